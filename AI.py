@@ -1,8 +1,8 @@
-from typing import List
-from llm_providers import OllamaProvider, GeminiProvider, LLMProviderFactory
+from typing import List, Optional
+from llm_providers import LLMProviderFactory
 import os
 from dotenv import load_dotenv
-import random
+import threading
 
 load_dotenv()
 
@@ -13,12 +13,33 @@ api_keys = [
     os.getenv("GEMINI_API_KEY3"),
 ]
 
-api_key = random.choice(api_keys)
-llm = LLMProviderFactory.create_provider(
-    provider_type="gemini",
-    api_key=api_key,
-    model_name="gemini-1.5-flash",
-)
+# Provider used by get_llm(): gemini (default), openai, ollama or fake
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini").lower()
+
+_llm = None
+_llm_lock = threading.Lock()
+
+
+def get_llm():
+    """Build the provider on first use so importing this module stays cheap"""
+    global _llm
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None and LLM_PROVIDER == "gemini":
+                # Requests are rotated across every configured key,
+                # see get_llm().key_pool.stats()
+                _llm = LLMProviderFactory.create_provider(
+                    provider_type="gemini",
+                    api_keys=api_keys,
+                    model_name=os.getenv("LLM_MODEL") or "gemini-1.5-flash",
+                )
+            elif _llm is None:
+                _llm = LLMProviderFactory.create_provider(
+                    provider_type=LLM_PROVIDER,
+                    api_key=os.getenv("OPENAI_API_KEY"),
+                    model_name=os.getenv("LLM_MODEL"),
+                )
+    return _llm
 
 
 # Uncomment if you have set up ollama
@@ -27,10 +48,36 @@ llm = LLMProviderFactory.create_provider(
 #     model_name="gemma2",
 # )
 
+# Or hedge slow Gemini responses with a local Ollama fallback
+# hedged_llm = LLMProviderFactory.create_hedged_provider(
+#     [
+#         {"provider_type": "gemini", "api_keys": api_keys, "model_name": "gemini-1.5-flash"},
+#         {"provider_type": "ollama", "model_name": "gemma2"},
+#     ]
+# )
+
+
+def llm_parse_stats() -> Optional[dict]:
+    """Parse outcomes of the provider, None if no LLM was used this run"""
+    return _llm.parse_stats() if _llm is not None else None
+
 
 def get_result(job_description: str, company: str = "") -> dict:
-    return llm.get_result(job_description, company)
+    return get_llm().get_result(job_description, company)
+
+
+def get_results_batch(job_descriptions: List[str], company: str = "") -> List[dict]:
+    return get_llm().get_results_batch(job_descriptions, company)
 
 
 def get_answers(question: str, options: List[dict] = None) -> dict:
-    return llm.get_answers(question, options)
+    return get_llm().get_answers(question, options)
+
+
+async def aget_result(job_description: str, company: str = "") -> dict:
+    return await get_llm().aget_result(job_description, company)
+
+
+async def aget_answers(question: str, options: List[dict] = None) -> dict:
+    return await get_llm().aget_answers(question, options)
+
@@ -0,0 +1,100 @@
+# benchmarks/discovery.py
+"""
+HTTP job discovery against recorded responses served by a local stub server.
+
+    python -m benchmarks.discovery [pages]
+
+"fresh connections" reads the listing pages and job descriptions one by
+one with a new connection per request. "pooled" is the default discovery
+setup: one keep-alive client, descriptions of a page read concurrently.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.stub_server import StubServer
+from config.settings import settings
+from sites.discovery import JobDiscovery, LinkedInDiscovery, MicrosoftDiscovery
+
+RECORDED_DIR = Path(__file__).parent / "recorded"
+
+# Seconds per response, roughly a round trip to the sites' CDNs
+LATENCY = 0.02
+
+EMPTY_MICROSOFT_PAGE = b'{"operationResult": {"result": {"jobs": []}}}'
+
+
+def record(server: StubServer, pages: int) -> None:
+    """Serve the recorded listing page for the first pages, then empty ones"""
+    linkedin_search = (RECORDED_DIR / "linkedin_search.html").read_bytes()
+    for page in range(pages):
+        start = page * LinkedInDiscovery.PAGE_SIZE
+        server.record(f"/jobs-guest/*/search?*&start={start}", linkedin_search)
+    server.record("/jobs-guest/*/search?*", b"")
+    server.record(
+        "/jobs-guest/jobs/api/jobPosting/*",
+        (RECORDED_DIR / "linkedin_job.html").read_bytes(),
+    )
+
+    microsoft_search = (RECORDED_DIR / "microsoft_search.json").read_bytes()
+    for page in range(pages):
+        server.record(f"/search?*&pg={page + 1}", microsoft_search, "application/json")
+    server.record("/search?*", EMPTY_MICROSOFT_PAGE, "application/json")
+    server.record(
+        "/job/*",
+        (RECORDED_DIR / "microsoft_job.json").read_bytes(),
+        "application/json",
+    )
+
+
+def run(server: StubServer, label: str, discovery: JobDiscovery) -> list:
+    server.reset_counters()
+    start = time.perf_counter()
+    jobs = [
+        job for page in discovery.pages() for job in discovery.fetch_descriptions(page)
+    ]
+    elapsed = time.perf_counter() - start
+    discovery.close()
+    print(
+        f"{label:<38} {len(jobs) / elapsed:8.1f} jobs/s "
+        f"{server.requests:5d} requests {server.connections:5d} connections"
+    )
+    return jobs
+
+
+def main(pages: int = 5) -> None:
+    with StubServer(latency=LATENCY) as server:
+        record(server, pages)
+        print(f"{pages} listing pages per site from {server.url}")
+
+        for discovery_class in (LinkedInDiscovery, MicrosoftDiscovery):
+            name = discovery_class.__name__
+            concurrency = settings.DISCOVERY_MAX_CONNECTIONS
+            settings.DISCOVERY_MAX_CONNECTIONS = 1
+            run(
+                server,
+                f"{name} fresh connections",
+                discovery_class(
+                    base_url=server.url,
+                    client=httpx.Client(
+                        limits=httpx.Limits(max_keepalive_connections=0)
+                    ),
+                ),
+            )
+            settings.DISCOVERY_MAX_CONNECTIONS = concurrency
+            jobs = run(
+                server,
+                f"{name} pooled",
+                discovery_class(base_url=server.url),
+            )
+
+            job = jobs[0]
+            print(f"  {job.title} at {job.company}, {job.url}")
+            print(f"  {len(job.description)} chars of description")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,121 @@
+# benchmarks/llm_overhead.py
+"""
+Per-call client overhead of the LLM providers against a local stub server.
+
+    python -m benchmarks.llm_overhead [calls]
+
+"fresh client" opens a new HTTP client for every request, which is what a
+provider without connection reuse pays. "pooled" goes through the
+providers with their long-lived keep-alive clients. For Gemini, "chat
+session" is the earlier provider code path (a chat session started per
+prompt on a genai.configure'd model) and "stateless" the current
+GeminiProvider. Both use the SDK's REST transport against the stub, the
+default gRPC transport can't be pointed at it.
+"""
+
+import sys
+import time
+
+import google.generativeai as genai
+import httpx
+
+from benchmarks.stub_server import StubServer
+from llm_providers.gemini_provider import GeminiProvider
+from llm_providers.key_pool import APIKeyPool
+from llm_providers.ollama_provider import OllamaProvider
+from llm_providers.opennAI_provider import OpenAIProvider
+
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "top_p": 0.8,
+    "top_k": 40,
+    "max_output_tokens": 1024,
+}
+
+PAYLOAD = {
+    "model": "stub",
+    "messages": [{"role": "user", "content": "Provide a matching percentage"}],
+}
+
+
+def run(server: StubServer, label: str, calls: int, call) -> None:
+    server.reset_counters()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<30} {elapsed / calls * 1000:8.2f} ms/call "
+        f"{server.connections:5d} connections"
+    )
+
+
+def fresh_client_call(server: StubServer) -> None:
+    with httpx.Client() as client:
+        client.post(f"{server.url}/v1/chat/completions", json=PAYLOAD)
+
+
+def chat_session_model(server: StubServer) -> genai.GenerativeModel:
+    """Gemini model set up like the provider before it reused its clients"""
+    genai.configure(
+        api_key="stub",
+        transport="rest",
+        client_options={"api_endpoint": server.url},
+    )
+    return genai.GenerativeModel("gemini-1.5-flash")
+
+
+def chat_session_call(model: genai.GenerativeModel) -> str:
+    chat = model.start_chat(history=[])
+    return chat.send_message("ping", generation_config=GENERATION_CONFIG).text
+
+
+def main(calls: int = 200) -> None:
+    with StubServer() as server:
+        pooled = httpx.Client()
+        openai = OpenAIProvider(api_key="stub", base_url=f"{server.url}/v1")
+        ollama = OllamaProvider(base_url=server.url)
+        # No per-key rate limit, the stub has no quota
+        gemini = GeminiProvider(
+            api_key=APIKeyPool(["stub"], requests_per_minute=10**9),
+            model_name="gemini-1.5-flash",
+            base_url=server.url,
+        )
+        gemini_chat = chat_session_model(server)
+
+        print(f"{calls} calls per scenario against {server.url}")
+        run(server, "fresh client (before)", calls, lambda: fresh_client_call(server))
+        run(
+            server,
+            "pooled client",
+            calls,
+            lambda: pooled.post(f"{server.url}/v1/chat/completions", json=PAYLOAD),
+        )
+        run(
+            server,
+            "OpenAIProvider (pooled)",
+            calls,
+            lambda: openai._get_llm_response("ping"),
+        )
+        run(
+            server,
+            "OllamaProvider (pooled)",
+            calls,
+            lambda: ollama._get_llm_response("ping"),
+        )
+        run(
+            server,
+            "Gemini chat session (before)",
+            calls,
+            lambda: chat_session_call(gemini_chat),
+        )
+        run(
+            server,
+            "GeminiProvider (stateless)",
+            calls,
+            lambda: gemini._get_llm_response("ping"),
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,91 @@
+# benchmarks/prefix_cache.py
+"""
+Prompt-prefix reuse of the static contexts against a local stub server.
+
+    python -m benchmarks.prefix_cache [calls]
+
+"baseline order" lays the prompts out like the templates before static
+contexts: the system message, then the resume ahead of the job description
+for matching, and the questions ahead of the resume for answers. "static
+context" sends the system message, resume and instructions first as the
+provider's system message and only the job description or questions as the
+prompt. The stub server caches both layouts by the same prefix rule.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.stub_server import StubServer
+from config.settings import settings
+from llm_providers.ollama_provider import OllamaProvider
+from llm_providers.opennAI_provider import OpenAIProvider
+from llm_providers.static_context import StaticContext
+
+# Seconds per uncached prompt token, roughly a local 9B model on a GPU
+TOKEN_LATENCY = 0.0002
+
+
+def run(server: StubServer, label: str, calls: int, call) -> None:
+    server.reset_counters()
+    start = time.perf_counter()
+    for i in range(calls):
+        call(i)
+    elapsed = time.perf_counter() - start
+    uncached = server.prompt_tokens - server.cached_tokens
+    print(
+        f"{label:<38} {elapsed / calls * 1000:8.2f} ms/call "
+        f"{uncached / calls:8.0f} uncached prompt tokens/call"
+    )
+
+
+def scenarios(provider, name: str, calls: int, server: StubServer) -> None:
+    jobs = [f"Job {i}: Python developer with Django and AWS" for i in range(calls)]
+    questions = [[{"question": f"Question {i}", "type": "text"}] for i in range(calls)]
+
+    def baseline(context: StaticContext, prompt: str, resume_first: bool) -> None:
+        parts = (context.content, prompt) if resume_first else (prompt, context.content)
+        provider._call_llm("\n\n".join(parts), context.system_message)
+
+    for kind, context, make_prompt, resume_first in (
+        (
+            "match",
+            provider.match_context,
+            lambda i: provider._format_match_prompt(jobs[i]),
+            True,
+        ),
+        (
+            "answers",
+            provider.answers_context,
+            lambda i: provider._format_answers_prompt(questions[i]),
+            False,
+        ),
+    ):
+        run(
+            server,
+            f"{name} {kind} baseline order",
+            calls,
+            lambda i: baseline(context, make_prompt(i), resume_first),
+        )
+        run(
+            server,
+            f"{name} {kind} static context",
+            calls,
+            lambda i: provider._call_llm(make_prompt(i), context.text),
+        )
+
+
+def main(calls: int = 50) -> None:
+    settings.LLM_CACHE_FILE = Path(tempfile.mkdtemp()) / "llm_cache.sqlite3"
+    with StubServer(token_latency=TOKEN_LATENCY) as server:
+        openai = OpenAIProvider(api_key="stub", base_url=f"{server.url}/v1")
+        ollama = OllamaProvider(base_url=server.url)
+
+        print(f"{calls} calls per scenario against {server.url}")
+        scenarios(openai, "OpenAIProvider", calls, server)
+        scenarios(ollama, "OllamaProvider", calls, server)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
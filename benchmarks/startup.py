@@ -0,0 +1,60 @@
+# benchmarks/startup.py
+"""
+Cold-start time of main.py.
+
+    python -m benchmarks.startup [runs]
+
+Imports main in fresh interpreters and reports the wall time, followed by
+the modules with the highest cumulative import time.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = "import main"
+
+
+def time_import(runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", TARGET], cwd=ROOT, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def slowest_imports(limit: int = 10) -> list:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", TARGET],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        rows.append((int(cumulative), module.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main(runs: int = 5) -> None:
+    timings = time_import(runs)
+    print(
+        f"{TARGET!r} over {runs} runs: "
+        f"min {min(timings) * 1000:.0f} ms, "
+        f"median {statistics.median(timings) * 1000:.0f} ms"
+    )
+    print("\nSlowest imports (cumulative):")
+    for cumulative, module in slowest_imports():
+        print(f"{cumulative / 1000:10.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
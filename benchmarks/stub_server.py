@@ -0,0 +1,243 @@
+# benchmarks/stub_server.py
+"""
+Local stand-in for the LLM HTTP APIs used by the benchmarks.
+
+Serves canned OpenAI chat completion, Gemini generateContent (REST) and
+Ollama generate responses over HTTP/1.1 keep-alive and counts how many TCP
+connections clients open.
+GET requests are answered with recorded responses, see StubServer.record.
+
+Prompt processing is simulated with one prefix cache model for every
+prompt layout: a request reuses the longest common prefix with the
+previous prompt of the model, whatever role the shared text has. OpenAI
+only caches prefixes of at least 1024 tokens, in 128 token steps, Ollama
+any prefix. Only uncached tokens cost ``token_latency`` seconds each. This
+is a rough model of the real caches, so the benchmarks show how prompt
+layouts compare under it, not what a hosted API bills.
+"""
+
+import fnmatch
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+MATCH_RESPONSE = '{"matching_percent": 80}'
+
+CHARS_PER_TOKEN = 4
+
+# Prompt caching of the OpenAI API
+OPENAI_MIN_CACHED_TOKENS = 1024
+OPENAI_CACHE_STEP = 128
+
+
+def _tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _common_prefix(a: str, b: str) -> int:
+    size = min(len(a), len(b))
+    for i in range(size):
+        if a[i] != b[i]:
+            return i
+    return size
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b"{}"
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.bytes_received += len(body)
+        return json.loads(body or b"{}")
+
+    def _send(self, payload: bytes, content_type: str = "application/json"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _process_prompt(self, total: int, cached: int) -> None:
+        """Simulate prompt evaluation of the uncached tokens"""
+        with self.server.lock:
+            self.server.prompt_tokens += total
+            self.server.cached_tokens += cached
+        time.sleep(self.server.latency + (total - cached) * self.server.token_latency)
+
+    def _cached_prefix(self, model: str, prompt: str) -> int:
+        """Tokens shared with the previous prompt of model"""
+        with self.server.lock:
+            previous = self.server.last_prompts.get(model, "")
+            self.server.last_prompts[model] = prompt
+        return _common_prefix(prompt, previous) // CHARS_PER_TOKEN
+
+    def _chat_prompt_tokens(self, body: dict) -> tuple:
+        messages = body.get("messages") or []
+        prompt = "".join(
+            f"{message.get('role')}:{message.get('content', '')}"
+            for message in messages
+        )
+        total = sum(_tokens(str(message.get("content", ""))) for message in messages)
+        cached = self._cached_prefix(body.get("model"), prompt)
+        if cached < OPENAI_MIN_CACHED_TOKENS:
+            cached = 0
+        return total, min(cached - cached % OPENAI_CACHE_STEP, total)
+
+    def _generate_prompt_tokens(self, body: dict) -> tuple:
+        prompt = f"{body.get('system') or ''}{body.get('prompt') or ''}"
+        return _tokens(prompt), self._cached_prefix(body.get("model"), prompt)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+        for pattern, content_type, payload in self.server.recorded:
+            if fnmatch.fnmatchcase(self.path, pattern):
+                time.sleep(self.server.latency)
+                self._send(payload, content_type)
+                return
+        self.send_error(404)
+
+    def do_POST(self):
+        body = self._read_body()
+
+        if self.path.endswith("/chat/completions"):
+            prompt_tokens, cached_tokens = self._chat_prompt_tokens(body)
+            self._process_prompt(prompt_tokens, cached_tokens)
+            payload = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": MATCH_RESPONSE},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": 1,
+                    "total_tokens": prompt_tokens + 1,
+                    "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                },
+            }
+            self._send(json.dumps(payload).encode())
+
+        elif ":generateContent" in self.path:
+            prompt = "".join(
+                str(part.get("text", ""))
+                for content in [body.get("systemInstruction") or {}]
+                + (body.get("contents") or [])
+                for part in content.get("parts") or []
+            )
+            prompt_tokens = _tokens(prompt)
+            self._process_prompt(prompt_tokens, 0)
+            payload = {
+                "candidates": [
+                    {
+                        "content": {"parts": [{"text": MATCH_RESPONSE}], "role": "model"},
+                        "finishReason": 1,
+                        "index": 0,
+                    }
+                ],
+                "usageMetadata": {
+                    "promptTokenCount": prompt_tokens,
+                    "candidatesTokenCount": 1,
+                    "totalTokenCount": prompt_tokens + 1,
+                },
+            }
+            self._send(json.dumps(payload).encode())
+
+        elif self.path == "/api/generate":
+            prompt_tokens, cached_tokens = self._generate_prompt_tokens(body)
+            self._process_prompt(prompt_tokens, cached_tokens)
+            chunks = [
+                {"model": body.get("model"), "response": MATCH_RESPONSE, "done": False},
+                {
+                    "model": body.get("model"),
+                    "response": "",
+                    "done": True,
+                    "done_reason": "stop",
+                    "context": [1, 2, 3],
+                    "prompt_eval_count": prompt_tokens - cached_tokens,
+                },
+            ]
+            if body.get("stream", True):
+                payload = "".join(json.dumps(chunk) + "\n" for chunk in chunks)
+                self._send(payload.encode(), "application/x-ndjson")
+            else:
+                self._send(
+                    json.dumps(
+                        {**chunks[0], **chunks[1], "response": MATCH_RESPONSE}
+                    ).encode()
+                )
+
+        else:
+            self.send_error(404)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.0, token_latency: float = 0.0):
+        super().__init__(("127.0.0.1", port), StubHandler)
+        self.latency = latency
+        self.token_latency = token_latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.bytes_received = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.last_prompts = {}
+        self.recorded = []
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(
+        self, pattern: str, payload: bytes, content_type: str = "text/html"
+    ) -> None:
+        """Answer GET requests whose path and query match pattern (fnmatch)"""
+        self.recorded.append((pattern, content_type, payload))
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+            self.bytes_received = 0
+            self.prompt_tokens = 0
+            self.cached_tokens = 0
+            self.last_prompts.clear()
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    with StubServer(port=8765) as server:
+        print(f"Stub LLM server listening on {server.url}")
+        threading.Event().wait()
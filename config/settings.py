@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
 
@@ -11,11 +11,80 @@ class Settings(BaseModel):
     # Browser settings
     BROWSER_TIMEOUT: int = 30
     IMPLICIT_WAIT: int = 1
+    BROWSER_WORKERS: int = 2  # parallel Firefox instances
+    BROWSER_PROFILES_DIR: Path = DATA_DIR / "profiles"  # one profile per worker
+    # Max workers on a site at once (a search and the applications to the
+    # jobs it finds each take one), sites not listed are only capped by
+    # BROWSER_WORKERS
+    BROWSER_SITE_LIMITS: Dict[str, int] = {"linkedin": 2, "microsoft": 2}
+    BROWSER_PATH_CACHE: Path = DATA_DIR / "browser_paths.json"
+    BROWSER_OFFLINE: bool = False  # never download geckodriver
+    # Warm profile (logged in, cached assets) copied into new worker profiles
+    BROWSER_PROFILE_TEMPLATE: Optional[Path] = None
+    BROWSER_HEADLESS: bool = False
+    # Lean mode blocks images, web fonts, media autoplay and trackers
+    BROWSER_LEAN: bool = False
+    # Origins that still load images in lean mode (e.g. embedded apply forms)
+    BROWSER_LEAN_ALLOWLIST: List[str] = [
+        "https://careers.microsoft.com",
+        "https://microsoft.icims.com",
+    ]
+    # A page is ready once its DOM has been quiet this long with no request
+    # in flight, requests running longer are taken for long polling
+    PAGE_QUIET_MS: int = 300
+    PAGE_LONG_REQUEST_MS: int = 2000
+    # Default cap in seconds on that wait, the 0.5s the earlier WebDriverWait
+    # checks allowed, since LinkedIn keeps polling and re-rendering
+    PAGE_READY_TIMEOUT: float = 0.5
+
+    # Job discovery settings
+    DISCOVERY_HTTP: bool = True  # list jobs and read descriptions without the browser
+    DISCOVERY_MAX_CONNECTIONS: int = 4  # also the concurrent description fetches
+    DISCOVERY_HTTP_TIMEOUT: float = 15.0  # seconds
 
     # Queue settings
     MAX_RETRIES: int = 3
     QUEUE_SLEEP_TIME: int = 5
 
+    # LLM cache settings
+    LLM_CACHE_FILE: Path = DATA_DIR / "llm_cache.sqlite3"
+    LLM_CACHE_TTL: int = 7 * 24 * 60 * 60  # seconds
+    LLM_CACHE_MAX_ENTRIES: int = 5000
+    LLM_ANSWER_STORE_TTL: int = 30 * 24 * 60 * 60  # seconds
+    LLM_BATCH_SIZE: int = 10  # job descriptions per batched match prompt
+    LLM_MAX_CONCURRENCY: int = 4  # concurrent async LLM requests
+    LLM_JSON_MODE: bool = True  # use the backend's native JSON output mode
+    LLM_JD_TOKEN_BUDGET: int = 1500  # job description tokens sent per job
+    LLM_STREAM_MATCH: bool = True  # stop reading once the score is known
+    GEMINI_REQUESTS_PER_MINUTE: int = 15  # per API key
+    LLM_KEY_COOLDOWN: int = 60  # seconds a key rests after a quota error
+    LLM_HEDGE_PERCENTILE: float = 0.9  # hedge once the primary is this slow
+    LLM_HEDGE_DEFAULT_DELAY: float = 8.0  # seconds, until latencies are known
+    LLM_HEDGE_MIN_SAMPLES: int = 5
+    LLM_BACKEND_MAX_FAILURES: int = 3  # consecutive failures before skipping
+    LLM_BACKEND_COOLDOWN: int = 120  # seconds a failing backend is skipped
+    OLLAMA_NUM_CTX: int = 4096  # context window requested from Ollama
+    OLLAMA_KEEP_ALIVE: str = "30m"  # how long Ollama keeps the model loaded
+    LLM_HTTP_MAX_CONNECTIONS: int = 10
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 120.0  # seconds
+    LLM_HTTP_TIMEOUT: float = 120.0  # seconds
+
+    # Fake LLM provider settings (offline load testing)
+    FAKE_LLM_LATENCY: float = 0.5  # median seconds per call
+    FAKE_LLM_LATENCY_SIGMA: float = 0.5  # log-normal spread of the latency
+    FAKE_LLM_ERROR_RATE: float = 0.0  # share of calls that raise
+    FAKE_LLM_MALFORMED_RATE: float = 0.0  # share of calls with broken JSON
+    FAKE_LLM_SEED: int = 0
+
+    # Match settings
+    MATCH_THRESHOLD: int = 75  # apply only above this matching percent
+    MATCH_PREFILTER_FLOOR: float = 0.03  # local cosine similarity, 0 disables
+    MATCH_STRIP_BOILERPLATE: bool = True  # drop benefits, EEO, "about us" text
+
+    # Screening question settings
+    METADATA_MATCH_THRESHOLD: float = 0.8  # trigram similarity to a metadata key
+    METADATA_MATCH_MARGIN: float = 0.1  # lead needed over a different answer
+
     class Config:
         case_sensitive = True
 
@@ -1,7 +1,12 @@
 # core/browser_manager.py
+import json
 import os
 import platform
-from typing import Optional
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service
 from selenium.webdriver.firefox.options import Options
@@ -9,11 +14,82 @@ from webdriver_manager.firefox import GeckoDriverManager
 from config.settings import settings
 from .exceptions import BrowserException
 from loguru import logger
+from utils.metrics import metrics
+
+# Parallel workers must not resolve geckodriver at the same time
+_driver_install_lock = threading.Lock()
+
+FIREFOX_PREFERENCES = {
+    "browser.download.folderList": 2,
+    "browser.download.manager.showWhenStarting": False,
+    "browser.download.dir": str(settings.DATA_DIR),
+    "browser.helperApps.neverAsk.saveToDisk": "application/pdf,application/x-pdf",
+    "browser.window.width": 1920,
+    "browser.window.height": 1080,
+}
+
+# Lean mode: skip the assets job pages spend most of their load time on
+LEAN_PREFERENCES = {
+    "permissions.default.image": 2,  # block images
+    "gfx.downloadable_fonts.enabled": False,
+    "browser.display.use_document_fonts": 0,
+    "media.autoplay.default": 5,  # block audio and video autoplay
+    "media.autoplay.blocking_policy": 2,
+    "privacy.trackingprotection.enabled": True,
+    "privacy.trackingprotection.socialtracking.enabled": True,
+    "privacy.trackingprotection.cryptomining.enabled": True,
+    "privacy.trackingprotection.fingerprinting.enabled": True,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+}
+
+# Chrome-privileged script granting image loading to the allowlisted origins
+ALLOW_IMAGES_SCRIPT = """
+for (const origin of arguments[0]) {
+    const principal =
+        Services.scriptSecurityManager.createContentPrincipalFromOrigin(origin);
+    Services.perms.addFromPrincipal(principal, "image", Services.perms.ALLOW_ACTION);
+}
+"""
+
+
+def _load_path_cache() -> Dict[str, str]:
+    try:
+        with open(settings.BROWSER_PATH_CACHE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _cached_path(name: str) -> Optional[str]:
+    """Cached path of name if it still points at an executable"""
+    path = _load_path_cache().get(name)
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+
+def _cache_path(name: str, path: str) -> None:
+    data = _load_path_cache()
+    data[name] = path
+    try:
+        settings.BROWSER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(settings.BROWSER_PATH_CACHE, "w") as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Failed to cache {name} path: {str(e)}")
 
 
 class BrowserManager:
-    def __init__(self, headless: bool = False):
-        self.headless = headless
+    def __init__(
+        self,
+        headless: Optional[bool] = None,
+        profile_dir: Optional[Path] = None,
+        lean: Optional[bool] = None,
+    ):
+        self.headless = settings.BROWSER_HEADLESS if headless is None else headless
+        self.profile_dir = profile_dir
+        self.lean = settings.BROWSER_LEAN if lean is None else lean
         self.driver: Optional[webdriver.Firefox] = None
 
     def _get_firefox_binary(self) -> Optional[str]:
@@ -39,21 +115,72 @@ class BrowserManager:
                 "/snap/bin/firefox",
             ]
 
+        if path := _cached_path("firefox"):
+            return path
+
         for path in possible_paths:
             if os.path.exists(path):
                 logger.info(f"Found Firefox binary at: {path}")
+                _cache_path("firefox", path)
                 return path
 
         return None
 
+    def _get_geckodriver(self) -> str:
+        """
+        Resolve geckodriver from the path cache, then PATH, and only then
+        through webdriver-manager, which needs the network.
+        """
+        with _driver_install_lock:
+            if path := _cached_path("geckodriver") or shutil.which("geckodriver"):
+                return path
+            if settings.BROWSER_OFFLINE:
+                raise BrowserException(
+                    "geckodriver not found and BROWSER_OFFLINE is set, install it "
+                    "on PATH or run once online to cache it"
+                )
+            path = GeckoDriverManager().install()
+            _cache_path("geckodriver", path)
+            return path
+
+    def _prepare_profile(self) -> None:
+        """Create the profile directory, seeded from the warm template profile"""
+        profile_dir = Path(self.profile_dir)
+        template = settings.BROWSER_PROFILE_TEMPLATE
+        if not profile_dir.exists() and template and Path(template).is_dir():
+            logger.info(f"Seeding browser profile {profile_dir} from {template}")
+            shutil.copytree(
+                template,
+                profile_dir,
+                ignore=shutil.ignore_patterns("lock", ".parentlock", "parent.lock"),
+            )
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
     def init_driver(self) -> webdriver.Firefox:
+        phases: Dict[str, float] = {}
+        phase_start = time.perf_counter()
+
+        def phase(name: str) -> None:
+            nonlocal phase_start
+            now = time.perf_counter()
+            phases[name] = now - phase_start
+            phase_start = now
+
         try:
             options = Options()
             if self.headless:
                 options.add_argument("--headless")
+            if self.profile_dir:
+                # A persistent profile of its own keeps this browser's cookies
+                # and cache apart from other instances
+                self._prepare_profile()
+                options.add_argument("-profile")
+                options.add_argument(str(self.profile_dir))
+            phase("profile")
 
             # Get Firefox binary path
             binary_path = self._get_firefox_binary()
+            phase("binary")
             if binary_path:
                 options.binary_location = binary_path
             else:
@@ -66,19 +193,19 @@ class BrowserManager:
                 )
 
             # Set up Firefox preferences
-            options.set_preference("browser.download.folderList", 2)
-            options.set_preference("browser.download.manager.showWhenStarting", False)
-            options.set_preference("browser.download.dir", str(settings.DATA_DIR))
-            options.set_preference(
-                "browser.helperApps.neverAsk.saveToDisk",
-                "application/pdf,application/x-pdf",
-            )
-            options.set_preference("browser.window.width", 1920)
-            options.set_preference("browser.window.height", 1080)
+            for name, value in FIREFOX_PREFERENCES.items():
+                options.set_preference(name, value)
+            if self.lean:
+                for name, value in LEAN_PREFERENCES.items():
+                    options.set_preference(name, value)
+                # Needed for the chrome context that sets site permissions
+                options.add_argument("-remote-allow-system-access")
 
             # Initialize the driver
-            service = Service(GeckoDriverManager().install())
+            service = Service(self._get_geckodriver())
+            phase("driver")
             driver = webdriver.Firefox(service=service, options=options)
+            phase("launch")
 
             # Configure timeouts
             driver.implicitly_wait(settings.IMPLICIT_WAIT)
@@ -86,7 +213,19 @@ class BrowserManager:
 
             self.driver = driver
             self.driver.set_window_size(1920, 1080)
-            logger.info("Firefox WebDriver initialized successfully")
+            if self.lean:
+                self._allow_lean_origins(driver)
+            phase("configure")
+
+            for name, seconds in phases.items():
+                metrics.observe("browser_start_seconds", seconds, phase=name)
+            logger.info(
+                f"Firefox WebDriver initialized in {sum(phases.values()):.2f}s ("
+                + ", ".join(
+                    f"{name} {seconds:.2f}s" for name, seconds in phases.items()
+                )
+                + ")"
+            )
             return driver
 
         except Exception as e:
@@ -100,6 +239,33 @@ class BrowserManager:
                 )
             raise BrowserException(f"Failed to initialize browser: {error_msg}")
 
+    @staticmethod
+    def _allow_lean_origins(driver: webdriver.Firefox) -> None:
+        """Let the allowlisted origins load images despite lean mode"""
+        if not settings.BROWSER_LEAN_ALLOWLIST:
+            return
+        try:
+            with driver.context(driver.CONTEXT_CHROME):
+                driver.execute_script(
+                    ALLOW_IMAGES_SCRIPT, settings.BROWSER_LEAN_ALLOWLIST
+                )
+        except Exception as e:
+            logger.warning(f"Failed to allowlist lean mode origins: {str(e)}")
+
+    def is_alive(self) -> bool:
+        """Whether the browser still answers WebDriver commands"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def restart(self) -> webdriver.Firefox:
+        self.quit()
+        return self.init_driver()
+
     def quit(self) -> None:
         if self.driver:
             try:
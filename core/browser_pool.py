@@ -0,0 +1,207 @@
+# core/browser_pool.py
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+from selenium import webdriver
+
+from config.settings import settings
+from utils.metrics import metrics
+from .browser_manager import BrowserManager
+from .exceptions import BrowserException, JobBotException
+from .queue_manager import JobQueue
+from .url_processor import URLProcessor
+
+# Seconds to wait before retrying a URL whose site is at its worker cap
+SITE_BUSY_SLEEP = 0.5
+
+HandlerFactory = Callable[[webdriver.Firefox], Dict]
+
+
+class BrowserWorker:
+    """One Firefox instance with its own profile and site handlers"""
+
+    def __init__(
+        self, index: int, handler_factory: HandlerFactory, headless: Optional[bool]
+    ):
+        self.index = index
+        self.name = f"browser-{index}"
+        self.handler_factory = handler_factory
+        self.browser_manager = BrowserManager(
+            headless=headless,
+            profile_dir=settings.BROWSER_PROFILES_DIR / f"worker-{index}",
+        )
+        self.url_processor: Optional[URLProcessor] = None
+
+    def start(self) -> None:
+        driver = self.browser_manager.init_driver()
+        self.url_processor = URLProcessor(self.handler_factory(driver))
+
+    def restart(self) -> None:
+        """Replace a crashed browser, handlers are rebuilt for the new driver"""
+        self.url_processor = None
+        self.browser_manager.quit()
+        self.start()
+
+    def quit(self) -> None:
+        self.browser_manager.quit()
+
+
+class BrowserPool:
+    """
+    Runs a JobQueue across several isolated browser workers.
+
+    Every worker has its own Firefox profile and site handlers. A site search
+    (e.g. "linkedin.com") only finds the matching jobs, their URLs go back to
+    the queue so that applications run in parallel across the workers. Each
+    site is capped by settings.BROWSER_SITE_LIMITS, a URL of a site that is
+    at its cap goes back to the queue for another worker to pick up later.
+    Only as many workers run as the queued URLs and site caps can keep busy,
+    and a worker starts its browser when it takes its first URL.
+    """
+
+    def __init__(
+        self,
+        handler_factory: HandlerFactory,
+        size: int = None,
+        headless: Optional[bool] = None,
+        site_limits: Dict[str, int] = None,
+    ):
+        self.size = size or settings.BROWSER_WORKERS
+        self.handler_factory = handler_factory
+        self.headless = headless
+        self.site_limits = (
+            settings.BROWSER_SITE_LIMITS if site_limits is None else site_limits
+        )
+        self.workers = []
+        # Searches queued or running, which can still add job URLs
+        self.searching = 0
+        self._searching_lock = threading.Lock()
+        self.site_slots = {
+            site: threading.BoundedSemaphore(limit)
+            for site, limit in self.site_limits.items()
+        }
+
+    def _dispatchable(self, job_queue: JobQueue) -> int:
+        """Workers the queued URLs can keep busy at once under the site caps"""
+        sites = Counter()
+        for url in job_queue.pending_urls():
+            try:
+                site = URLProcessor.get_site_type(url)
+            except JobBotException:
+                site = None
+            # A search keeps adding jobs, as many as there are workers
+            sites[site] += self.size if URLProcessor.is_search(url) else 1
+        return sum(
+            min(count, self.site_limits.get(site, count))
+            for site, count in sites.items()
+        )
+
+    def run(self, job_queue: JobQueue, credentials: Dict) -> None:
+        """Process the queue until it is empty"""
+        size = min(self.size, self._dispatchable(job_queue))
+        if not size:
+            return
+        self.searching = sum(
+            URLProcessor.is_search(url) for url in job_queue.pending_urls()
+        )
+        logger.info(f"Running {size} browser workers")
+        self.workers = [
+            BrowserWorker(index, self.handler_factory, self.headless)
+            for index in range(size)
+        ]
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(worker, job_queue, credentials),
+                name=worker.name,
+            )
+            for worker in self.workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if not job_queue.is_empty() and not any(
+            worker.url_processor for worker in self.workers
+        ):
+            raise BrowserException("No browser worker could be started")
+
+    @staticmethod
+    def _start_worker(worker: BrowserWorker) -> bool:
+        try:
+            worker.start()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start {worker.name}: {str(e)}")
+            return False
+
+    def _next_url(self, job_queue: JobQueue) -> Optional[str]:
+        """Next queued URL, waiting while searches can still add jobs"""
+        while (url := job_queue.get_next_url()) is None and self.searching:
+            time.sleep(SITE_BUSY_SLEEP)
+        return url
+
+    def _search(
+        self, worker: BrowserWorker, url: str, job_queue: JobQueue, credentials: Dict
+    ) -> None:
+        """Queue the matching jobs of a site search for any worker to apply to"""
+        try:
+            for job_url in worker.url_processor.find_jobs(url, credentials):
+                job_queue.add_url(job_url)
+        finally:
+            self._search_done()
+
+    def _search_done(self) -> None:
+        with self._searching_lock:
+            self.searching -= 1
+
+    def _work(self, worker: BrowserWorker, job_queue: JobQueue, credentials: Dict):
+        while (url := self._next_url(job_queue)) is not None:
+            try:
+                site = URLProcessor.get_site_type(url)
+            except JobBotException as e:
+                logger.error(f"Error processing {url}: {str(e)}")
+                if URLProcessor.is_search(url):
+                    self._search_done()
+                continue
+
+            slots = self.site_slots.get(site)
+            if slots and not slots.acquire(blocking=False):
+                job_queue.requeue(url)
+                time.sleep(SITE_BUSY_SLEEP)
+                continue
+
+            if worker.url_processor is None and not self._start_worker(worker):
+                job_queue.requeue(url)
+                if slots:
+                    slots.release()
+                return
+
+            try:
+                logger.info(f"{worker.name} processing {url}")
+                with metrics.timer("url_seconds", site=site):
+                    if URLProcessor.is_search(url):
+                        self._search(worker, url, job_queue, credentials)
+                    else:
+                        worker.url_processor.process_url(url, credentials)
+            except Exception as e:
+                logger.error(f"Error processing {url}: {str(e)}")
+            finally:
+                if slots:
+                    slots.release()
+
+            if not worker.browser_manager.is_alive():
+                logger.warning(f"{worker.name} browser crashed, restarting")
+                try:
+                    worker.restart()
+                except Exception as e:
+                    logger.error(f"Failed to restart {worker.name}: {str(e)}")
+                    return
+
+    def quit(self) -> None:
+        for worker in self.workers:
+            worker.quit()
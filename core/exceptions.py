@@ -16,5 +16,11 @@ class ApplicationException(JobBotException):
     pass
 
 
+class DiscoveryException(JobBotException):
+    """Raised when jobs cannot be discovered over HTTP"""
+
+    pass
+
+
 class TimeoutException(Exception):
     pass
@@ -1,5 +1,5 @@
 from typing import Dict, List
-from queue import Queue
+from queue import Empty, Queue
 from loguru import logger
 
 
@@ -25,9 +25,19 @@ class JobQueue:
 
     def get_next_url(self) -> str:
         """Get the next URL from the queue"""
-        if not self.queue.empty():
-            return self.queue.get()
-        return None
+        try:
+            return self.queue.get_nowait()
+        except Empty:
+            return None
+
+    def pending_urls(self) -> List[str]:
+        """URLs currently waiting in the queue, without removing them"""
+        with self.queue.mutex:
+            return list(self.queue.queue)
+
+    def requeue(self, url: str) -> None:
+        """Put a URL back to be picked up later"""
+        self.queue.put(url)
 
     def is_empty(self) -> bool:
         """Check if queue is empty"""
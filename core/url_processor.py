@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Iterator
 from urllib.parse import urlparse
 from loguru import logger
 from core.exceptions import JobBotException
@@ -8,7 +8,8 @@ class URLProcessor:
     def __init__(self, site_handlers: Dict):
         self.site_handlers = site_handlers
 
-    def get_site_type(self, url: str) -> str:
+    @staticmethod
+    def get_site_type(url: str) -> str:
         """Determine the site type from URL"""
         domain = url
 
@@ -19,23 +20,33 @@ class URLProcessor:
         else:
             raise JobBotException(f"Unsupported job site: {domain}")
 
-    def process_url(self, url: str, credentials: Dict) -> None:
-        """Process a single job URL"""
-        try:
-            site_type = self.get_site_type(url)
+    @staticmethod
+    def is_search(url: str) -> bool:
+        """A site search such as "linkedin.com" rather than a job url"""
+        return not urlparse(url).netloc
 
-            if site_type not in self.site_handlers:
-                raise JobBotException(f"No handler found for site type: {site_type}")
+    def _prepare_handler(self, url: str, credentials: Dict):
+        """Site handler of url, logged in with its credentials"""
+        site_type = self.get_site_type(url)
 
-            handler = self.site_handlers[site_type]
-            handler.credentials = credentials[site_type]
-            handler.site_type = site_type
+        if site_type not in self.site_handlers:
+            raise JobBotException(f"No handler found for site type: {site_type}")
 
-            # Login if needed
+        handler = self.site_handlers[site_type]
+        handler.credentials = credentials[site_type]
+        handler.site_type = site_type
 
-            if not handler.is_logged_in() and handler.login_required:
-                logger.info(f"Logging in to {handler.site_type}")
-                handler.login()
+        # Login if needed
+
+        if not handler.is_logged_in() and handler.login_required:
+            logger.info(f"Logging in to {handler.site_type}")
+            handler.login()
+        return handler
+
+    def process_url(self, url: str, credentials: Dict) -> None:
+        """Process a single job URL"""
+        try:
+            handler = self._prepare_handler(url, credentials)
 
             # Apply to job
             handler.apply_to_job(url)
@@ -44,3 +55,11 @@ class URLProcessor:
         except Exception as e:
             logger.error(f"Failed to process job {url}: {str(e)}")
             raise
+
+    def find_jobs(self, url: str, credentials: Dict) -> Iterator[str]:
+        """Urls of the matching jobs of a site search, without applying"""
+        try:
+            yield from self._prepare_handler(url, credentials).find_jobs(url)
+        except Exception as e:
+            logger.error(f"Failed to search jobs {url}: {str(e)}")
+            raise
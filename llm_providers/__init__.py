@@ -1,6 +1,36 @@
-from .gemini_provider import GeminiProvider
-from .ollama_provider import OllamaProvider
-from .opennAI_provider import OpenAIProvider
-from .factory import LLMProviderFactory
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["GeminiProvider", "OllamaProvider", "OpenAIProvider", "LLMProviderFactory"]
+# Providers pull in heavy SDKs (langchain, google.generativeai), so they are
+# only imported when first accessed.
+_EXPORTS = {
+    "GeminiProvider": ".gemini_provider",
+    "OllamaProvider": ".ollama_provider",
+    "OpenAIProvider": ".opennAI_provider",
+    "FakeProvider": ".fake_provider",
+    "LLMProviderFactory": ".factory",
+}
+
+if TYPE_CHECKING:
+    from .gemini_provider import GeminiProvider
+    from .ollama_provider import OllamaProvider
+    from .opennAI_provider import OpenAIProvider
+    from .fake_provider import FakeProvider
+    from .factory import LLMProviderFactory
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "GeminiProvider",
+    "OllamaProvider",
+    "OpenAIProvider",
+    "FakeProvider",
+    "LLMProviderFactory",
+]
@@ -1,16 +1,57 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import AsyncIterator, List, Dict, Any, Iterator, Optional, Tuple
 from langchain.prompts import PromptTemplate
 from langchain.output_parsers import ResponseSchema, StructuredOutputParser
 import json
 from json_repair import repair_json
 import os
+import re
 
+import threading
+import time
+from collections import Counter
 from loguru import logger
+from config.settings import settings
+from utils.metrics import metrics
+from .cache import PersistentCache
+from .static_context import StaticContext
+from .tokens import compact_json, count_tokens, truncate_to_tokens
+
+# A complete matching_percent value, the digits must be followed by a
+# terminator so that "8" is not mistaken for the start of "85"
+MATCHING_PERCENT_PATTERN = re.compile(
+    r'"matching_percent"\s*:\s*"?(\d{1,3})\s*%?\s*[",}\s]'
+)
+
+PARSE_STAT_KEYS = (
+    "llm_calls",
+    "retries",
+    "parse_strict",
+    "parse_fenced",
+    "parse_repaired",
+    "parse_failures",
+)
 
 
 class BaseLLMProvider(ABC):
+    # Bump whenever the prompts change so cached results are not reused
+    PROMPT_VERSION = "3"
+    provider_name = "base"
+    # Prompt + completion tokens the backend accepts, None when unknown
+    context_window: Optional[int] = None
+    max_output_tokens = 1024
+    # "backend" when called by a composite provider, so its time isn't
+    # counted twice in the LLM time of a run
+    metrics_role = "call"
+
     def __init__(self):
+        self.model_name = None
+        self._semaphore = None
+        self.json_mode = settings.LLM_JSON_MODE
+        self.stats = Counter()
+        # Calls run on worker, hedge and event loop threads
+        self._stats_lock = threading.Lock()
         base_path = os.path.dirname(os.path.dirname(__file__))
         self.resume = json.loads(
             open(os.path.join(base_path, "data", "resume.json")).read()
@@ -18,9 +59,38 @@ class BaseLLMProvider(ABC):
         self.metadata = json.loads(
             open(os.path.join(base_path, "data", "metadata.json")).read()
         )
+        self._setup_contexts()
         self._setup_parsers()
         self._setup_prompts()
         self._setup_system_messages()
+        self._setup_static_contexts()
+        self.result_cache = PersistentCache(
+            settings.LLM_CACHE_FILE,
+            table="match_results",
+            ttl_seconds=settings.LLM_CACHE_TTL,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+        self.answer_store = PersistentCache(
+            settings.LLM_CACHE_FILE,
+            table="screening_answers",
+            ttl_seconds=settings.LLM_ANSWER_STORE_TTL,
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        )
+
+    def _setup_contexts(self):
+        """Precompute compact encodings of the resume and metadata."""
+        # Contact details don't affect matching, only answers need them
+        match_resume = {
+            key: value for key, value in self.resume.items() if key != "personalInfo"
+        }
+        self.match_resume_context = compact_json(match_resume)
+        self.resume_context = compact_json(self.resume)
+        self.metadata_context = compact_json(self.metadata)
+        logger.debug(
+            f"Prompt contexts: match resume {count_tokens(self.match_resume_context)} tokens, "
+            f"resume {count_tokens(self.resume_context)} tokens, "
+            f"metadata {count_tokens(self.metadata_context)} tokens"
+        )
 
     def _setup_system_messages(self):
         """Set up system messages for different tasks."""
@@ -50,67 +120,138 @@ class BaseLLMProvider(ABC):
             )
         ]
 
+        self.batch_match_schemas = [
+            ResponseSchema(
+                name="results",
+                description='list of objects with the job "id" and its "matching_percent" which should be a 2 digit number',
+                type="List[dict]",
+            )
+        ]
+
         self.match_parser = StructuredOutputParser.from_response_schemas(
             self.match_schemas
         )
         self.get_answers_parser = StructuredOutputParser.from_response_schemas(
             self.get_answers_schemas
         )
+        self.batch_match_parser = StructuredOutputParser.from_response_schemas(
+            self.batch_match_schemas
+        )
 
     def _setup_prompts(self):
+        # Only the job description or questions change between calls, the
+        # resume and instructions live in the static contexts below
         self.match_prompt = PromptTemplate(
-            template="""Provide a matching percentage for {my_resume} and {job_description} for {company} in JSON format.
-            
+            template="""Provide a matching percentage of my_resume and this job_description for {company} in JSON format.
+
+            job_description:
+            ```
+            {job_description}
+            ```""",
+            input_variables=["job_description", "company"],
+        )
+
+        self.batch_match_prompt = PromptTemplate(
+            template="""Provide a matching percentage of my_resume against each of these job descriptions for {company} in JSON format.
+
+            jobs:
+            ```json
+            {jobs}
+            ```""",
+            input_variables=["jobs", "company"],
+        )
+
+        self.get_answers_prompt = PromptTemplate(
+            template="""Answer these questions in JSON format.
+
+            questions:
+            ```json
+            {questions}
+            ```""",
+            input_variables=["questions"],
+        )
+
+    def _setup_static_contexts(self):
+        """Build the prompt prefixes shared by every call of a kind."""
+        self.match_context = StaticContext(
+            name="match",
+            system_message=self.match_system_message,
+            content=f"""my_resume:
+            ```json
+            {self.match_resume_context}
+            ```
+
             Output:
             ```json
-            {format_instructions}
+            {self.match_parser.get_format_instructions()}
             ```
             Please ensure the review includes:
             - Match percentage of my_resume and job_description
             - Respond should be parsable JSON.
             - No other information is required.
             - Just respond with json containing "matching_percent"
-            
+
             Return the response in valid JSON format.""",
-            input_variables=["my_resume", "job_description", "company"],
-            partial_variables={
-                "format_instructions": self.match_parser.get_format_instructions()
-            },
         )
 
-        self.get_answers_prompt = PromptTemplate(
-            template="""You are a human being and a software developer applying job online. Always answer like a human being
-            Output:     
-            {format_instructions}
-    
-            questions:
-             ```json
-            {questions}
+        self.batch_match_context = StaticContext(
+            name="batch_match",
+            system_message=self.match_system_message,
+            content=f"""my_resume:
+            ```json
+            {self.match_resume_context}
             ```
 
-            resume: 
+            Output:
             ```json
-            {my_resume}
+            {self.batch_match_parser.get_format_instructions()}
+            ```
+            Please ensure the review includes:
+            - One entry per job, using the "id" of the job
+            - Match percentage of my_resume and each job_description
+            - Respond should be parsable JSON.
+            - No other information is required.
+
+            Return the response in valid JSON format.""",
+        )
+
+        self.answers_context = StaticContext(
+            name="answers",
+            system_message=self.get_answers_system_message,
+            content=f"""You are a human being and a software developer applying job online. Always answer like a human being
+            Output:
+            {self.get_answers_parser.get_format_instructions()}
+
+            resume:
+            ```json
+            {self.resume_context}
             ```
 
             metadata:
             ```json
-            {metadata}
+            {self.metadata_context}
             ```
 
-            
             Please ensure the option and data includes only the appropriate option from options if options are not provided respond with descriptive answer that is suitable for the question and resume and metadata.
-            - Return the response in valid JSON   
+            - Return the response in valid JSON
             - Response should always match with the given options.
             - Avoid Descriptive answers.
             - Prefer answering direct in number values if options are not provided.
-            - If options are not provided return json with descriptive answer should be in string 
-            
+            - If options are not provided return json with descriptive answer should be in string
+
             Return the response in valid JSON format.""",
-            input_variables=["my_resume", "questions", "metadata"],
-            partial_variables={
-                "format_instructions": self.get_answers_parser.get_format_instructions()
-            },
+        )
+
+        self.static_contexts = [
+            self.match_context,
+            self.batch_match_context,
+            self.answers_context,
+        ]
+        logger.debug(
+            "Static contexts: "
+            + ", ".join(
+                f"{ctx.name} {ctx.tokens} tokens" for ctx in self.static_contexts
+            )
         )
 
     @abstractmethod
@@ -118,44 +259,485 @@ class BaseLLMProvider(ABC):
         """Abstract method to get response from specific LLM provider."""
         pass
 
+    async def _aget_llm_response(self, prompt: str, system_message: str = None) -> str:
+        """
+        Get response from the LLM provider without blocking the event loop.
+
+        Providers with a native async client should override this, the default
+        runs the blocking call in a worker thread.
+        """
+        return await asyncio.to_thread(self._get_llm_response, prompt, system_message)
+
+    def _stream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> Iterator[str]:
+        """
+        Yield the response in chunks as it is generated. Providers with
+        streaming support override this, the default yields it in one piece.
+        """
+        yield self._get_llm_response(prompt, system_message)
+
+    async def _astream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> AsyncIterator[str]:
+        """Async counterpart of _stream_llm_response"""
+        yield await self._aget_llm_response(prompt, system_message)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Concurrency limiter for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY))
+        return self._semaphore[1]
+
+    def _count_prompt_tokens(self, prompt: str, system_message: str = None) -> int:
+        """Report the prompt size and warn if it won't fit the context window"""
+        static_tokens = count_tokens(system_message)
+        prompt_tokens = count_tokens(prompt) + static_tokens
+        metrics.observe(
+            "llm_static_prompt_tokens", static_tokens, **self._metric_labels()
+        )
+        logger.debug(
+            f"{self.provider_name} prompt: {prompt_tokens} tokens, "
+            f"{static_tokens} of them static"
+        )
+        if (
+            self.context_window
+            and prompt_tokens + self.max_output_tokens > self.context_window
+        ):
+            logger.warning(
+                f"Prompt of {prompt_tokens} tokens exceeds the {self.context_window} "
+                f"token context window of {self.provider_name} and will be truncated"
+            )
+        return prompt_tokens
+
+    def _metric_labels(self) -> Dict[str, str]:
+        return {
+            "provider": self.provider_name,
+            "model": self.model_name,
+            "role": self.metrics_role,
+        }
+
+    def _count(self, key: str) -> None:
+        """Increment a provider stat and the matching process-wide counter"""
+        with self._stats_lock:
+            self.stats[key] += 1
+        metrics.inc(f"llm_{key}", **self._metric_labels())
+
+    def _count_retry(self, attempt: int) -> None:
+        if attempt:
+            self._count("retries")
+
+    def _start_call(self, prompt: str, system_message: str = None) -> float:
+        prompt_tokens = self._count_prompt_tokens(prompt, system_message)
+        metrics.observe("llm_prompt_tokens", prompt_tokens, **self._metric_labels())
+        with self._stats_lock:
+            self.stats["llm_calls"] += 1
+        return time.perf_counter()
+
+    def _finish_call(self, start: float, response: Optional[str]) -> None:
+        """Record latency and completion size, or an error if response is None"""
+        labels = self._metric_labels()
+        metrics.observe("llm_request_seconds", time.perf_counter() - start, **labels)
+        if response is None:
+            metrics.inc("llm_errors", **labels)
+            return
+        metrics.inc("llm_requests", **labels)
+        metrics.observe("llm_completion_tokens", count_tokens(response), **labels)
+
+    def _call_llm(self, prompt: str, system_message: str = None) -> str:
+        start = self._start_call(prompt, system_message)
+        response = None
+        try:
+            response = self._get_llm_response(prompt, system_message)
+            return response
+        finally:
+            self._finish_call(start, response)
+
+    async def _acall_llm(self, prompt: str, system_message: str = None) -> str:
+        async with self._get_semaphore():
+            start = self._start_call(prompt, system_message)
+            response = None
+            try:
+                response = await self._aget_llm_response(prompt, system_message)
+                return response
+            finally:
+                self._finish_call(start, response)
+
+    @staticmethod
+    def _scan_matching_percent(text: str) -> Optional[int]:
+        """Return the matching percent once it is complete in text"""
+        if match := MATCHING_PERCENT_PATTERN.search(text):
+            return int(match.group(1))
+        return None
+
+    def _end_match_stream(self, text: str, percent: Optional[int]) -> str:
+        """The response to parse, reduced to the score when read early"""
+        if percent is None:
+            return text
+        self._count("stream_early_stops")
+        if percent <= settings.MATCH_THRESHOLD:
+            logger.debug(f"Rejecting job at {percent}% without reading further")
+        return json.dumps({"matching_percent": percent})
+
+    def _call_llm_match(self, prompt: str, system_message: str = None) -> str:
+        """
+        Like _call_llm for match prompts, but when streaming is enabled the
+        stream is abandoned as soon as a complete matching_percent is read.
+        """
+        if not settings.LLM_STREAM_MATCH:
+            return self._call_llm(prompt, system_message)
+
+        start = self._start_call(prompt, system_message)
+        text, percent = "", None
+        try:
+            stream = self._stream_llm_response(prompt, system_message)
+            try:
+                for chunk in stream:
+                    text += chunk
+                    if (percent := self._scan_matching_percent(text)) is not None:
+                        break
+            finally:
+                stream.close()
+        except Exception:
+            self._finish_call(start, None)
+            raise
+        self._finish_call(start, text)
+        return self._end_match_stream(text, percent)
+
+    async def _acall_llm_match(self, prompt: str, system_message: str = None) -> str:
+        """Async counterpart of _call_llm_match"""
+        if not settings.LLM_STREAM_MATCH:
+            return await self._acall_llm(prompt, system_message)
+
+        async with self._get_semaphore():
+            start = self._start_call(prompt, system_message)
+            text, percent = "", None
+            try:
+                stream = self._astream_llm_response(prompt, system_message)
+                try:
+                    async for chunk in stream:
+                        text += chunk
+                        if (percent := self._scan_matching_percent(text)) is not None:
+                            break
+                finally:
+                    await stream.aclose()
+            except Exception:
+                self._finish_call(start, None)
+                raise
+            self._finish_call(start, text)
+        return self._end_match_stream(text, percent)
+
     def _parse_json_response(self, response: str) -> dict:
+        """
+        Parse the JSON in a response. Strict parsing is tried first since
+        native JSON mode returns plain JSON, markdown fences are stripped next
+        and repair_json is only the last resort.
+        """
+        try:
+            parsed = self._loads_object(response)
+            self._count("parse_strict")
+            return parsed
+        except (TypeError, ValueError):
+            pass
+
         json_content = response
         if "```json" in response:
             json_content = response.split("```json")[1].split("```")[0].strip()
         elif "```" in response:
             json_content = response.split("```")[1].split("```")[0].strip()
-        return json.loads(repair_json(json_content))
 
-    def get_result(self, job_description: str, company: str = "") -> Optional[dict]:
-        formatted_prompt = self.match_prompt.format(
-            my_resume=self.resume, job_description=job_description, company=company
+        try:
+            parsed = self._loads_object(json_content)
+            self._count("parse_fenced")
+            return parsed
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            parsed = self._loads_object(repair_json(json_content))
+            self._count("parse_repaired")
+            return parsed
+        except (TypeError, ValueError):
+            self._count("parse_failures")
+            raise
+
+    @staticmethod
+    def _loads_object(content: str) -> dict:
+        parsed = json.loads(content)
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Expected a JSON object, got {type(parsed).__name__}")
+        return parsed
+
+    def parse_stats(self) -> Dict[str, Any]:
+        """Parse outcomes and retry rate of the LLM calls made so far"""
+        with self._stats_lock:
+            stats = Counter(self.stats)
+        parsed = sum(
+            stats[key] for key in ("parse_strict", "parse_fenced", "parse_repaired")
+        )
+        attempts = parsed + stats["parse_failures"]
+        calls = stats["llm_calls"]
+        return {
+            **{key: stats[key] for key in PARSE_STAT_KEYS},
+            "repair_rate": (
+                round(stats["parse_repaired"] / attempts, 3) if attempts else 0.0
+            ),
+            "failure_rate": (
+                round(stats["parse_failures"] / attempts, 3) if attempts else 0.0
+            ),
+            "retry_rate": round(stats["retries"] / calls, 3) if calls else 0.0,
+        }
+
+    def _match_cache_key(self, job_description: str, company: str = "") -> str:
+        return PersistentCache.make_key(
+            self.resume,
+            job_description,
+            company,
+            self.provider_name,
+            self.model_name,
+            self.PROMPT_VERSION,
+        )
+
+    @staticmethod
+    def _trim_job_description(job_description: str) -> str:
+        return truncate_to_tokens(job_description, settings.LLM_JD_TOKEN_BUDGET)
+
+    def _format_match_prompt(self, job_description: str, company: str = "") -> str:
+        return self.match_prompt.format(
+            job_description=self._trim_job_description(job_description),
+            company=company,
         )
 
-        for _ in range(3):
+    def _accept_match(self, response: str, cache_key: str) -> Optional[dict]:
+        """Parse a match response and cache it if it holds a matching percent"""
+        parsed_response = self._parse_json_response(response)
+        if parsed_response.get("matching_percent"):
+            self.result_cache.set(cache_key, parsed_response)
+            return parsed_response
+        return None
+
+    def get_result(self, job_description: str, company: str = "") -> Optional[dict]:
+        cache_key = self._match_cache_key(job_description, company)
+        if (cached := self.result_cache.get(cache_key)) is not None:
+            logger.debug(f"Match result cache hit for {company or 'job'}")
+            return cached
+
+        formatted_prompt = self._format_match_prompt(job_description, company)
+
+        response = None
+        for attempt in range(3):
             try:
-                response = self._get_llm_response(
-                    formatted_prompt, self.match_system_message
+                self._count_retry(attempt)
+                response = self._call_llm_match(
+                    formatted_prompt, self.match_context.text
                 )
-                parsed_response = self._parse_json_response(response)
-                if parsed_response.get("matching_percent"):
+                if parsed_response := self._accept_match(response, cache_key):
                     return parsed_response
             except Exception as e:
                 logger.error(f"Response: {response}, Error : {e}")
         return None
 
-    def get_answers(self, questions: str, options: List[dict] = None) -> Optional[dict]:
-        formatted_prompt = self.get_answers_prompt.format(
-            my_resume=self.resume,
-            questions=questions,
-            options=options,
-            metadata=self.metadata,
+    async def aget_result(
+        self, job_description: str, company: str = ""
+    ) -> Optional[dict]:
+        """Async counterpart of get_result"""
+        cache_key = self._match_cache_key(job_description, company)
+        if (cached := self.result_cache.get(cache_key)) is not None:
+            logger.debug(f"Match result cache hit for {company or 'job'}")
+            return cached
+
+        formatted_prompt = self._format_match_prompt(job_description, company)
+
+        response = None
+        for attempt in range(3):
+            try:
+                self._count_retry(attempt)
+                response = await self._acall_llm_match(
+                    formatted_prompt, self.match_context.text
+                )
+                if parsed_response := self._accept_match(response, cache_key):
+                    return parsed_response
+            except Exception as e:
+                logger.error(f"Response: {response}, Error : {e}")
+        return None
+
+    def _score_batch(
+        self, job_descriptions: List[str], company: str = ""
+    ) -> Dict[int, dict]:
+        """Score a chunk of job descriptions in a single LLM call, keyed by index"""
+        jobs = [
+            {"id": i, "job_description": self._trim_job_description(description)}
+            for i, description in enumerate(job_descriptions)
+        ]
+        formatted_prompt = self.batch_match_prompt.format(
+            jobs=compact_json(jobs),
+            company=company,
         )
 
+        response = None
+        for attempt in range(3):
+            try:
+                self._count_retry(attempt)
+                response = self._call_llm(
+                    formatted_prompt, self.batch_match_context.text
+                )
+                scores = {}
+                for item in self._parse_json_response(response).get("results", []):
+                    try:
+                        index = int(item["id"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if 0 <= index < len(jobs) and item.get("matching_percent"):
+                        scores[index] = {"matching_percent": item["matching_percent"]}
+                if scores:
+                    return scores
+            except Exception as e:
+                logger.error(f"Response: {response}, Error : {e}")
+        return {}
+
+    def get_results_batch(
+        self, job_descriptions: List[str], company: str = ""
+    ) -> List[Optional[dict]]:
+        """
+        Score several job descriptions against the resume.
+
+        Cached results are reused, the rest are sent in chunks of
+        settings.LLM_BATCH_SIZE jobs per prompt. Jobs missing from a batch
+        response fall back to get_result.
+        """
+        keys = [self._match_cache_key(jd, company) for jd in job_descriptions]
+        results = [self.result_cache.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        for start in range(0, len(pending), settings.LLM_BATCH_SIZE):
+            chunk = pending[start : start + settings.LLM_BATCH_SIZE]
+            scores = self._score_batch([job_descriptions[i] for i in chunk], company)
+            for position, i in enumerate(chunk):
+                if position in scores:
+                    results[i] = scores[position]
+                    self.result_cache.set(keys[i], results[i])
+                else:
+                    results[i] = self.get_result(job_descriptions[i], company)
+
+        return results
+
+    def _answer_cache_key(self, question: dict) -> str:
+        options = sorted(
+            self._normalize_question(str(opt)) for opt in question.get("options") or []
+        )
+        return PersistentCache.make_key(
+            self._normalize_question(question.get("question", "")),
+            options,
+            self.resume,
+            self.metadata,
+        )
+
+    @staticmethod
+    def _normalize_question(text: str) -> str:
+        return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+    def _format_answers_prompt(
+        self, questions: List[dict], options: List[dict] = None
+    ) -> str:
+        return self.get_answers_prompt.format(questions=compact_json(questions))
+
+    def _query_answers(
+        self, questions: List[dict], options: List[dict] = None
+    ) -> Optional[dict]:
+        try:
+            response = self._call_llm(
+                self._format_answers_prompt(questions, options),
+                self.answers_context.text,
+            )
+            return self._parse_json_response(response)
+        except Exception as e:
+            logger.error(f"Failed to get answers: {str(e)}")
+            return None
+
+    async def _aquery_answers(
+        self, questions: List[dict], options: List[dict] = None
+    ) -> Optional[dict]:
         try:
-            response = self._get_llm_response(
-                formatted_prompt, self.get_answers_system_message
+            response = await self._acall_llm(
+                self._format_answers_prompt(questions, options),
+                self.answers_context.text,
             )
             return self._parse_json_response(response)
         except Exception as e:
-            print(f"Error: {e}")
+            logger.error(f"Failed to get answers: {str(e)}")
             return None
+
+    @staticmethod
+    def _is_question_list(questions) -> bool:
+        return isinstance(questions, list) and all(
+            isinstance(question, dict) for question in questions
+        )
+
+    def _lookup_answers(self, questions: List[dict]) -> Tuple[List[str], list, list]:
+        """Return answer store keys, known answers and indexes still unanswered"""
+        keys = [self._answer_cache_key(question) for question in questions]
+        answers = [self.answer_store.get(key) for key in keys]
+        pending = [i for i, answer in enumerate(answers) if answer is None]
+        return keys, answers, pending
+
+    def _merge_answers(
+        self,
+        questions: List[dict],
+        keys: List[str],
+        answers: list,
+        pending: List[int],
+        response: Optional[dict],
+    ) -> Optional[dict]:
+        """Fill the pending answers from the LLM response and store them"""
+        if pending:
+            if not response:
+                return None
+
+            new_answers = response.get("answers") or []
+            if len(new_answers) != len(pending):
+                # Answers can't be lined up with their questions, so none of
+                # them are stored
+                logger.warning(
+                    f"Expected {len(pending)} answers, got {len(new_answers)}"
+                )
+                return response if len(pending) == len(questions) else None
+
+            for i, answer in zip(pending, new_answers):
+                answers[i] = answer
+                self.answer_store.set(keys[i], answer)
+
+        logger.debug(
+            f"Answered {len(questions) - len(pending)}/{len(questions)} questions from store"
+        )
+        return {"answers": answers}
+
+    def get_answers(self, questions: str, options: List[dict] = None) -> Optional[dict]:
+        """
+        Answer screening questions, reusing answers given on earlier applications.
+
+        Only questions missing from the answer store are sent to the LLM.
+        """
+        if not self._is_question_list(questions):
+            return self._query_answers(questions, options)
+
+        keys, answers, pending = self._lookup_answers(questions)
+        response = None
+        if pending:
+            response = self._query_answers([questions[i] for i in pending], options)
+        return self._merge_answers(questions, keys, answers, pending, response)
+
+    async def aget_answers(
+        self, questions: str, options: List[dict] = None
+    ) -> Optional[dict]:
+        """Async counterpart of get_answers"""
+        if not self._is_question_list(questions):
+            return await self._aquery_answers(questions, options)
+
+        keys, answers, pending = self._lookup_answers(questions)
+        response = None
+        if pending:
+            response = await self._aquery_answers(
+                [questions[i] for i in pending], options
+            )
+        return self._merge_answers(questions, keys, answers, pending, response)
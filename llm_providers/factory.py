@@ -1,25 +1,49 @@
 # providers/factory.py
-from typing import Optional, Union
-from .base_provider import BaseLLMProvider
-from .opennAI_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
-from .gemini_provider import GeminiProvider
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from .base_provider import BaseLLMProvider
+    from .hedged_provider import HedgedProvider
+
+# Provider modules are imported on demand so that only the SDK of the
+# provider actually used gets loaded.
+PROVIDER_MODULES = {
+    "openai": (".opennAI_provider", "OpenAIProvider"),
+    "ollama": (".ollama_provider", "OllamaProvider"),
+    "gemini": (".gemini_provider", "GeminiProvider"),
+    "hedged": (".hedged_provider", "HedgedProvider"),
+    "fake": (".fake_provider", "FakeProvider"),
+}
 
 
 class LLMProviderFactory:
+    @staticmethod
+    def load_provider_class(provider_type: str) -> Type["BaseLLMProvider"]:
+        """Import and return the provider class registered for provider_type"""
+        if provider_type not in PROVIDER_MODULES:
+            raise ValueError(f"Unsupported provider type: {provider_type}")
+        module_name, class_name = PROVIDER_MODULES[provider_type]
+        return getattr(importlib.import_module(module_name, __package__), class_name)
+
     @staticmethod
     def create_provider(
         provider_type: str,
         api_key: Optional[str] = None,
         model_name: Optional[str] = None,
-    ) -> BaseLLMProvider:
+        api_keys: Optional[List[str]] = None,
+        base_url: Optional[str] = None,
+    ) -> "BaseLLMProvider":
         """
         Create and return an LLM provider instance based on the specified type.
 
         Args:
-            provider_type: Type of provider ('openai', 'ollama', or 'gemini')
+            provider_type: Type of provider ('openai', 'ollama', 'gemini' or 'fake')
             api_key: API key for providers that require it
             model_name: Optional model name to use
+            api_keys: Several API keys to rotate between (Gemini only)
+            base_url: Optional API endpoint override (OpenAI, Ollama and
+                Gemini, which then uses the REST transport)
 
         Returns:
             An instance of the specified LLM provider
@@ -29,19 +53,52 @@ class LLMProviderFactory:
         if provider_type == "openai":
             if not api_key:
                 raise ValueError("OpenAI provider requires an API key")
-            return OpenAIProvider(
-                api_key=api_key, model_name=model_name or "gpt-3.5-turbo"
+            return LLMProviderFactory.load_provider_class("openai")(
+                api_key=api_key,
+                model_name=model_name or "gpt-3.5-turbo",
+                base_url=base_url,
             )
 
         elif provider_type == "ollama":
-            return OllamaProvider(model_name=model_name or "gemma2")
+            return LLMProviderFactory.load_provider_class("ollama")(
+                model_name=model_name or "gemma2", base_url=base_url
+            )
 
         elif provider_type == "gemini":
-            if not api_key:
+            api_keys = [key for key in api_keys or [api_key] if key]
+            if not api_keys:
                 raise ValueError("Gemini provider requires an API key")
-            return GeminiProvider(
-                api_key=api_key, model_name=model_name or "gemini-pro"
+            return LLMProviderFactory.load_provider_class("gemini")(
+                api_key=api_keys,
+                model_name=model_name or "gemini-pro",
+                base_url=base_url,
+            )
+
+        elif provider_type == "fake":
+            return LLMProviderFactory.load_provider_class("fake")(
+                model_name=model_name or "fake"
             )
 
         else:
             raise ValueError(f"Unsupported provider type: {provider_type}")
+
+    @staticmethod
+    def create_hedged_provider(
+        provider_configs: List[Dict], **kwargs
+    ) -> "HedgedProvider":
+        """
+        Create a provider that hedges and fails over across several backends.
+
+        Args:
+            provider_configs: create_provider keyword arguments for every
+                backend, in order of preference
+            **kwargs: Extra HedgedProvider options (hedge_percentile,
+                max_failures, failure_cooldown)
+
+        Returns:
+            A HedgedProvider wrapping the configured backends
+        """
+        providers = [
+            LLMProviderFactory.create_provider(**config) for config in provider_configs
+        ]
+        return LLMProviderFactory.load_provider_class("hedged")(providers, **kwargs)
@@ -0,0 +1,172 @@
+# providers/fake_provider.py
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from typing import AsyncIterator, Iterator, List, Optional
+
+from config.settings import settings
+from .base_provider import BaseLLMProvider
+
+QUESTIONS_PATTERN = re.compile(r"questions:\s*```json\s*(.*?)\s*```", re.DOTALL)
+JOBS_PATTERN = re.compile(r"jobs:\s*```json\s*(.*?)\s*```", re.DOTALL)
+
+# Verbose models tend to explain their answer after the JSON
+TRAILING_PROSE = (
+    "\n\nThe score reflects how closely the candidate's skills, experience and "
+    "qualifications match the requirements listed in the job description."
+)
+STREAM_CHUNK_CHARS = 16
+
+
+class FakeLLMError(RuntimeError):
+    """Simulated backend failure"""
+
+
+class FakeProvider(BaseLLMProvider):
+    """
+    Offline stand-in for a real LLM backend, meant for load testing.
+
+    Responses follow the match, batch match and answer schemas. Latency is
+    drawn from a log-normal distribution around ``latency`` seconds, and a
+    share of the calls fail or return malformed JSON so the retry and repair
+    paths get exercised. Given the same seed a run is reproducible, and
+    matching percentages depend only on the prompt.
+    """
+
+    provider_name = "fake"
+
+    def __init__(
+        self,
+        model_name: str = "fake",
+        latency: float = None,
+        latency_sigma: float = None,
+        error_rate: float = None,
+        malformed_rate: float = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__()
+        self.model_name = model_name
+        self.latency = settings.FAKE_LLM_LATENCY if latency is None else latency
+        self.latency_sigma = (
+            settings.FAKE_LLM_LATENCY_SIGMA if latency_sigma is None else latency_sigma
+        )
+        self.error_rate = (
+            settings.FAKE_LLM_ERROR_RATE if error_rate is None else error_rate
+        )
+        self.malformed_rate = (
+            settings.FAKE_LLM_MALFORMED_RATE
+            if malformed_rate is None
+            else malformed_rate
+        )
+        self._random = random.Random(settings.FAKE_LLM_SEED if seed is None else seed)
+        self._lock = threading.Lock()
+
+    def _draw(self):
+        """Latency and outcome of the next call"""
+        with self._lock:
+            latency = (
+                self._random.lognormvariate(0, self.latency_sigma) * self.latency
+                if self.latency > 0
+                else 0.0
+            )
+            roll = self._random.random()
+        failed = roll < self.error_rate
+        malformed = not failed and roll < self.error_rate + self.malformed_rate
+        return latency, failed, malformed
+
+    @staticmethod
+    def _score(text: str) -> int:
+        """Deterministic two digit matching percent for text"""
+        return 10 + zlib.crc32(text.encode("utf-8")) % 90
+
+    @staticmethod
+    def _extract(pattern: re.Pattern, prompt: str) -> list:
+        match = pattern.search(prompt)
+        if not match:
+            return []
+        try:
+            items = json.loads(match.group(1))
+        except ValueError:
+            return []
+        return items if isinstance(items, list) else []
+
+    @staticmethod
+    def _answer(question) -> str:
+        if isinstance(question, dict) and question.get("options"):
+            return str(question["options"][0])
+        return "1"
+
+    def _build_response(self, prompt: str, system_message: str = None) -> dict:
+        if system_message == self.answers_context.text:
+            questions = self._extract(QUESTIONS_PATTERN, prompt)
+            return {"answers": [self._answer(question) for question in questions]}
+
+        if jobs := self._extract(JOBS_PATTERN, prompt):
+            return {
+                "results": [
+                    {
+                        "id": job.get("id"),
+                        "matching_percent": self._score(
+                            str(job.get("job_description", ""))
+                        ),
+                    }
+                    for job in jobs
+                    if isinstance(job, dict)
+                ]
+            }
+
+        return {"matching_percent": self._score(prompt)}
+
+    def _respond(
+        self, prompt: str, system_message: str, failed: bool, malformed: bool
+    ) -> str:
+        if failed:
+            raise FakeLLMError("Simulated LLM backend failure")
+
+        response = json.dumps(self._build_response(prompt, system_message))
+        if malformed:
+            # Fenced and cut short, recoverable only by the repair path
+            return f"Here is the result:\n```json\n{response[:-1]}\n```"
+        return response
+
+    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+        latency, failed, malformed = self._draw()
+        time.sleep(latency)
+        return self._respond(prompt, system_message, failed, malformed)
+
+    def _stream_chunks(
+        self, prompt: str, system_message: str, failed: bool, malformed: bool
+    ) -> List[str]:
+        response = self._respond(prompt, system_message, failed, malformed)
+        text = response + TRAILING_PROSE
+        return [
+            text[i : i + STREAM_CHUNK_CHARS]
+            for i in range(0, len(text), STREAM_CHUNK_CHARS)
+        ]
+
+    def _stream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> Iterator[str]:
+        latency, failed, malformed = self._draw()
+        chunks = self._stream_chunks(prompt, system_message, failed, malformed)
+        for chunk in chunks:
+            time.sleep(latency / len(chunks))
+            yield chunk
+
+    async def _astream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> AsyncIterator[str]:
+        latency, failed, malformed = self._draw()
+        chunks = self._stream_chunks(prompt, system_message, failed, malformed)
+        for chunk in chunks:
+            await asyncio.sleep(latency / len(chunks))
+            yield chunk
+
+    async def _aget_llm_response(self, prompt: str, system_message: str = None) -> str:
+        latency, failed, malformed = self._draw()
+        await asyncio.sleep(latency)
+        return self._respond(prompt, system_message, failed, malformed)
@@ -1,33 +1,202 @@
 # providers/gemini_provider.py
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+from loguru import logger
 from .base_provider import BaseLLMProvider
+from .key_pool import APIKeyPool
+from config.settings import settings
 import google.generativeai as genai
 from google.generativeai.types import ContentType
 
+# genai.configure is process global, so clients bound to one key each need
+# the SDK's private client manager. It is only relied on in the
+# google-generativeai version pinned in requirements.txt, other versions fall
+# back to a single globally configured key.
+try:
+    from google.generativeai.client import _ClientManager
+except ImportError:
+    _ClientManager = None
+
+# Models without JSON output mode and system instructions
+LEGACY_MODELS = ("gemini-pro", "gemini-1.0-pro")
+
 
 class GeminiProvider(BaseLLMProvider):
-    def __init__(self, api_key: str, model_name="gemini-pro"):
-        super().__init__()
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(model_name)
+    provider_name = "gemini"
 
-    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
-        # Combine system message and prompt for Gemini
-        if system_message:
-            full_prompt = f"{system_message}\n\nUser: {prompt}\n\nAssistant:"
+    def __init__(
+        self,
+        api_key: Union[str, List[str], APIKeyPool],
+        model_name="gemini-pro",
+        base_url: Optional[str] = None,
+    ):
+        super().__init__()
+        self.model_name = model_name
+        # A custom endpoint (e.g. a local stub) is reached over REST
+        self.client_config = (
+            {"transport": "rest", "client_options": {"api_endpoint": base_url}}
+            if base_url
+            else {}
+        )
+        if isinstance(api_key, APIKeyPool):
+            self.key_pool = api_key
         else:
-            full_prompt = prompt
-
-        chat = self.model.start_chat(history=[])
-        response = chat.send_message(
-            full_prompt,
-            generation_config={
-                "temperature": 0.7,
-                "top_p": 0.8,
-                "top_k": 40,
-                "max_output_tokens": 1024,
-            },
+            self.key_pool = APIKeyPool(
+                [api_key] if isinstance(api_key, str) else api_key,
+                requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+                cooldown_seconds=settings.LLM_KEY_COOLDOWN,
+            )
+        self.per_key_clients = self._supports_per_key_clients()
+        if not self.per_key_clients:
+            key = self.key_pool.keys[0]
+            if len(self.key_pool.keys) > 1:
+                logger.warning(
+                    "Installed google-generativeai can't bind clients to a key, "
+                    "only the first Gemini API key is used"
+                )
+                self.key_pool = APIKeyPool(
+                    [key],
+                    requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+                    cooldown_seconds=settings.LLM_KEY_COOLDOWN,
+                )
+            genai.configure(api_key=key, **self.client_config)
+        self.clients = (
+            {key: self._make_client(key) for key in self.key_pool.keys}
+            if self.per_key_clients
+            else {}
         )
-        return response.text
+        self.models: Dict[Tuple[str, Optional[str]], genai.GenerativeModel] = {}
+        # The static contexts become system instructions, so only the per-call
+        # prompt is sent as user content
+        for context in self.static_contexts:
+            for key in self.key_pool.keys:
+                self._get_model(key, context.text)
+        self.generation_config = {
+            "temperature": 0.7,
+            "top_p": 0.8,
+            "top_k": 40,
+            "max_output_tokens": self.max_output_tokens,
+        }
+        if self.json_mode and self._supports_json_mode():
+            self.generation_config["response_mime_type"] = "application/json"
+
+    def _supports_json_mode(self) -> bool:
+        # JSON output is only available from the 1.5 models onwards
+        return self.model_name not in LEGACY_MODELS
+
+    def _supports_system_instruction(self) -> bool:
+        return self.model_name not in LEGACY_MODELS
+
+    def _supports_per_key_clients(self) -> bool:
+        """Whether the SDK still has the private client manager and model slots"""
+        if _ClientManager is None:
+            return False
+        model = genai.GenerativeModel(self.model_name)
+        return hasattr(model, "_client") and hasattr(model, "_async_client")
+
+    def _make_client(self, api_key: str) -> "_ClientManager":
+        """
+        genai.configure is process global, so every key gets a dedicated
+        client manager instead.
+        """
+        client = _ClientManager()
+        client.configure(api_key=api_key, **self.client_config)
+        return client
+
+    def _get_model(
+        self, api_key: str, system_message: str = None
+    ) -> genai.GenerativeModel:
+        """Model bound to api_key, with system_message as its system instruction"""
+        if not self._supports_system_instruction():
+            system_message = None
+        model_key = (api_key, system_message)
+        if model_key not in self.models:
+            model = genai.GenerativeModel(
+                self.model_name, system_instruction=system_message
+            )
+            if self.per_key_clients:
+                model._client = self.clients[api_key].get_default_client(
+                    "generative"
+                )
+            self.models[model_key] = model
+        return self.models[model_key]
+
+    def _get_async_model(
+        self, api_key: str, system_message: str = None
+    ) -> genai.GenerativeModel:
+        # grpc aio channels must be created inside the running event loop
+        model = self._get_model(api_key, system_message)
+        if self.per_key_clients and model._async_client is None:
+            model._async_client = self.clients[api_key].get_default_client(
+                "generative_async"
+            )
+        return model
+
+    def _format_prompt(self, prompt: str, system_message: str = None) -> str:
+        # Older models take no system instruction, combine it with the prompt
+        if system_message and not self._supports_system_instruction():
+            return f"{system_message}\n\nUser: {prompt}\n\nAssistant:"
+        return prompt
+
+    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+        key = self.key_pool.acquire()
+        try:
+            # Stateless call, a chat session per prompt only adds overhead
+            response = self._get_model(key, system_message).generate_content(
+                self._format_prompt(prompt, system_message),
+                generation_config=self.generation_config,
+            )
+            return response.text
+        except Exception as e:
+            self.key_pool.report_error(key, e)
+            raise
+
+    async def _aget_llm_response(self, prompt: str, system_message: str = None) -> str:
+        key = await self.key_pool.aacquire()
+        try:
+            response = await self._get_async_model(
+                key, system_message
+            ).generate_content_async(
+                self._format_prompt(prompt, system_message),
+                generation_config=self.generation_config,
+            )
+            return response.text
+        except Exception as e:
+            self.key_pool.report_error(key, e)
+            raise
+
+    def _stream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> Iterator[str]:
+        key = self.key_pool.acquire()
+        try:
+            response = self._get_model(key, system_message).generate_content(
+                self._format_prompt(prompt, system_message),
+                generation_config=self.generation_config,
+                stream=True,
+            )
+            for chunk in response:
+                yield chunk.text
+        except Exception as e:
+            self.key_pool.report_error(key, e)
+            raise
+
+    async def _astream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> AsyncIterator[str]:
+        key = await self.key_pool.aacquire()
+        try:
+            response = await self._get_async_model(
+                key, system_message
+            ).generate_content_async(
+                self._format_prompt(prompt, system_message),
+                generation_config=self.generation_config,
+                stream=True,
+            )
+            async for chunk in response:
+                yield chunk.text
+        except Exception as e:
+            self.key_pool.report_error(key, e)
+            raise
 
     def _format_chat_history(self, messages):
         formatted_messages = []
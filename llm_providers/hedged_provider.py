@@ -0,0 +1,150 @@
+# providers/hedged_provider.py
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from config.settings import settings
+from .base_provider import BaseLLMProvider
+
+
+class HedgedProvider(BaseLLMProvider):
+    """
+    Composite provider that sends each prompt to several backends.
+
+    The first backend gets the request. When it has not answered within its
+    observed latency percentile a hedged request goes to the next backend,
+    and the first response that parses wins. Failed requests fail over to
+    the next backend right away, and backends that fail repeatedly are
+    skipped for a cooldown period.
+    """
+
+    provider_name = "hedged"
+
+    def __init__(
+        self,
+        providers: List[BaseLLMProvider],
+        hedge_percentile: float = None,
+        max_failures: int = None,
+        failure_cooldown: float = None,
+    ):
+        if not providers:
+            raise ValueError("Hedged provider requires at least one provider")
+        super().__init__()
+        self.providers = providers
+        for provider in providers:
+            provider.metrics_role = "backend"
+        self.model_name = ",".join(
+            f"{provider.provider_name}:{provider.model_name}" for provider in providers
+        )
+        self.hedge_percentile = hedge_percentile or settings.LLM_HEDGE_PERCENTILE
+        self.max_failures = max_failures or settings.LLM_BACKEND_MAX_FAILURES
+        self.failure_cooldown = failure_cooldown or settings.LLM_BACKEND_COOLDOWN
+
+        self._latencies: Dict[int, deque] = {
+            id(provider): deque(maxlen=100) for provider in providers
+        }
+        self._failures: Dict[int, int] = {id(provider): 0 for provider in providers}
+        self._skip_until: Dict[int, float] = {
+            id(provider): 0.0 for provider in providers
+        }
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(providers) * settings.LLM_MAX_CONCURRENCY,
+            thread_name_prefix="hedged-llm",
+        )
+
+    def _available_providers(self) -> List[BaseLLMProvider]:
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                provider
+                for provider in self.providers
+                if self._skip_until[id(provider)] <= now
+            ]
+        # When every backend is tripped, trying them is better than failing
+        return available or list(self.providers)
+
+    def _hedge_delay(self, provider: BaseLLMProvider) -> float:
+        """Latency percentile of the provider, the default until enough samples"""
+        with self._lock:
+            samples = sorted(self._latencies[id(provider)])
+        if len(samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DEFAULT_DELAY
+        index = min(len(samples) - 1, int(len(samples) * self.hedge_percentile))
+        return samples[index]
+
+    def _record(self, provider: BaseLLMProvider, latency: Optional[float]) -> None:
+        key = id(provider)
+        with self._lock:
+            if latency is not None:
+                self._latencies[key].append(latency)
+                self._failures[key] = 0
+                return
+
+            self._failures[key] += 1
+            if self._failures[key] >= self.max_failures:
+                self._skip_until[key] = time.monotonic() + self.failure_cooldown
+                self._failures[key] = 0
+                logger.warning(
+                    f"Skipping {provider.provider_name} for {self.failure_cooldown}s "
+                    f"after {self.max_failures} consecutive failures"
+                )
+
+    def _attempt(
+        self, provider: BaseLLMProvider, prompt: str, system_message: str = None
+    ) -> str:
+        """Call one backend and only return responses that parse"""
+        start = time.monotonic()
+        try:
+            response = provider._call_llm(prompt, system_message)
+            provider._parse_json_response(response)
+        except Exception:
+            self._record(provider, None)
+            raise
+        self._record(provider, time.monotonic() - start)
+        return response
+
+    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+        candidates = self._available_providers()
+        pending: Dict[Future, BaseLLMProvider] = {}
+        last_error: Optional[Exception] = None
+
+        def launch() -> None:
+            provider = candidates.pop(0)
+            pending[
+                self._executor.submit(self._attempt, provider, prompt, system_message)
+            ] = provider
+
+        launch()
+        while pending:
+            # Hedge after the latency percentile of the oldest request in flight
+            timeout = (
+                self._hedge_delay(next(iter(pending.values()))) if candidates else None
+            )
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                self._count("hedged_requests")
+                logger.debug(f"Hedging request after {timeout:.1f}s")
+                launch()
+                continue
+
+            for future in done:
+                provider = pending.pop(future)
+                try:
+                    response = future.result()
+                    self._count(f"wins_{provider.provider_name}")
+                    return response
+                except Exception as e:
+                    last_error = e
+                    logger.warning(f"{provider.provider_name} failed: {str(e)}")
+
+            if not pending and candidates:
+                self._count("failovers")
+                launch()
+
+        raise last_error or RuntimeError("No LLM provider available")
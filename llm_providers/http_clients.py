@@ -0,0 +1,23 @@
+# providers/http_clients.py
+import httpx
+
+from config.settings import settings
+
+
+def pool_limits() -> httpx.Limits:
+    """Connection pool limits shared by the HTTP based providers"""
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def make_http_client() -> httpx.Client:
+    """Long-lived client that keeps connections alive between LLM calls"""
+    return httpx.Client(limits=pool_limits(), timeout=settings.LLM_HTTP_TIMEOUT)
+
+
+def make_async_http_client() -> httpx.AsyncClient:
+    """Async counterpart of make_http_client"""
+    return httpx.AsyncClient(limits=pool_limits(), timeout=settings.LLM_HTTP_TIMEOUT)
@@ -0,0 +1,139 @@
+# providers/key_pool.py
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+@dataclass
+class KeyState:
+    """Token bucket and usage counters of a single API key"""
+
+    key: str
+    tokens: float
+    updated_at: float = field(default_factory=time.monotonic)
+    cooldown_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+    quota_errors: int = 0
+
+
+class APIKeyPool:
+    """
+    Rotates requests across several API keys.
+
+    Every key has a token bucket refilled at ``requests_per_minute``. Keys that
+    hit a quota error are cooled down for ``cooldown_seconds`` while the rest
+    of the pool keeps serving requests.
+    """
+
+    def __init__(
+        self,
+        keys: List[Optional[str]],
+        requests_per_minute: float = 15,
+        cooldown_seconds: float = 60,
+    ):
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys:
+            raise ValueError("API key pool requires at least one API key")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, float(requests_per_minute))
+        self.cooldown_seconds = cooldown_seconds
+        self._states: Dict[str, KeyState] = {
+            key: KeyState(key=key, tokens=self.capacity) for key in keys
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._states)
+
+    def _refill(self, state: KeyState, now: float) -> None:
+        state.tokens = min(
+            self.capacity, state.tokens + (now - state.updated_at) * self.rate
+        )
+        state.updated_at = now
+
+    def _available_in(self, state: KeyState, now: float) -> float:
+        """Seconds until this key can serve another request"""
+        cooling = max(0.0, state.cooldown_until - now)
+        refill = max(0.0, (1 - state.tokens) / self.rate) if self.rate else 0.0
+        return max(cooling, refill)
+
+    def _reserve(self) -> Tuple[str, float]:
+        """Reserve a request slot on the key that frees up first"""
+        now = time.monotonic()
+        with self._lock:
+            for state in self._states.values():
+                self._refill(state, now)
+            state = min(
+                self._states.values(),
+                key=lambda s: (self._available_in(s, now), -s.tokens, s.requests),
+            )
+            wait = self._available_in(state, now)
+            state.tokens -= 1
+            state.requests += 1
+            return state.key, wait
+
+    def acquire(self) -> str:
+        """Return a key to use, sleeping if every key is exhausted"""
+        key, wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"All API keys busy, waiting {wait:.1f}s")
+            time.sleep(wait)
+        return key
+
+    async def aacquire(self) -> str:
+        """Async counterpart of acquire"""
+        key, wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"All API keys busy, waiting {wait:.1f}s")
+            await asyncio.sleep(wait)
+        return key
+
+    @staticmethod
+    def is_quota_error(error: Exception) -> bool:
+        if getattr(error, "code", None) == 429:
+            return True
+        name = type(error).__name__
+        message = str(error).lower()
+        return (
+            name in ("ResourceExhausted", "TooManyRequests", "RateLimitError")
+            or "429" in message
+            or "quota" in message
+        )
+
+    def report_error(self, key: str, error: Exception) -> None:
+        """Record a failed request and cool the key down on quota errors"""
+        with self._lock:
+            state = self._states[key]
+            state.errors += 1
+            if self.is_quota_error(error):
+                state.quota_errors += 1
+                state.cooldown_until = time.monotonic() + self.cooldown_seconds
+                logger.warning(
+                    f"API key {self._mask(key)} hit its quota, "
+                    f"cooling down for {self.cooldown_seconds}s"
+                )
+
+    @staticmethod
+    def _mask(key: str) -> str:
+        return f"...{key[-4:]}"
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-key usage, keyed by the masked API key"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                self._mask(state.key): {
+                    "requests": state.requests,
+                    "errors": state.errors,
+                    "quota_errors": state.quota_errors,
+                    "cooling_down": state.cooldown_until > now,
+                }
+                for state in self._states.values()
+            }
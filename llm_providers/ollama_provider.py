@@ -1,23 +1,39 @@
+from typing import AsyncIterator, Iterator, Optional
 from .base_provider import BaseLLMProvider
+from .http_clients import pool_limits
+from config.settings import settings
 from langchain_ollama import OllamaLLM
 
 
 class OllamaProvider(BaseLLMProvider):
-    def __init__(self, model_name="gemma2", temperature=0.7):
+    provider_name = "ollama"
+
+    def __init__(
+        self, model_name="gemma2", temperature=0.7, base_url: Optional[str] = None
+    ):
         super().__init__()
+        self.model_name = model_name
+        self.context_window = settings.OLLAMA_NUM_CTX
         self.llm = OllamaLLM(
             model=model_name,
             temperature=temperature,
-            num_ctx=2048,  # Context window size
-            num_predict=1024,  # Max tokens to generate
+            num_ctx=self.context_window,  # Context window size
+            num_predict=self.max_output_tokens,  # Max tokens to generate
             top_k=40,
             top_p=0.8,
             repeat_penalty=1.1,
+            format="json" if self.json_mode else "",
+            keep_alive=settings.OLLAMA_KEEP_ALIVE,  # Keep the model loaded
+            base_url=base_url,
+            client_kwargs={
+                "limits": pool_limits(),
+                "timeout": settings.LLM_HTTP_TIMEOUT,
+            },
         )
 
-    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+    def _format_prompt(self, prompt: str, system_message: str = None) -> str:
         if system_message:
-            formatted_prompt = f"""<s>system
+            return f"""<s>system
 {system_message}
 </s>
 <s>user
@@ -25,7 +41,23 @@ class OllamaProvider(BaseLLMProvider):
 </s>
 <s>assistant
 """
-        else:
-            formatted_prompt = prompt
+        return prompt
+
+    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+        return self.llm.invoke(self._format_prompt(prompt, system_message))
+
+    async def _aget_llm_response(self, prompt: str, system_message: str = None) -> str:
+        return await self.llm.ainvoke(self._format_prompt(prompt, system_message))
+
+    def _stream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> Iterator[str]:
+        yield from self.llm.stream(self._format_prompt(prompt, system_message))
 
-        return self.llm.invoke(formatted_prompt)
+    async def _astream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> AsyncIterator[str]:
+        async for chunk in self.llm.astream(
+            self._format_prompt(prompt, system_message)
+        ):
+            yield chunk
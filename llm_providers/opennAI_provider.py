@@ -1,23 +1,60 @@
+from typing import AsyncIterator, Iterator, Optional
 from .base_provider import BaseLLMProvider
+from .http_clients import make_async_http_client, make_http_client
 from langchain_openai import ChatOpenAI
 from langchain.schema import SystemMessage, HumanMessage
 
 
 class OpenAIProvider(BaseLLMProvider):
-    def __init__(self, api_key: str, model_name="gpt-3.5-turbo", temperature=0.7):
+    provider_name = "openai"
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name="gpt-3.5-turbo",
+        temperature=0.7,
+        base_url: Optional[str] = None,
+    ):
         super().__init__()
+        self.model_name = model_name
         self.llm = ChatOpenAI(
             api_key=api_key,
             model_name=model_name,
             temperature=temperature,
-            max_tokens=1024,
+            max_tokens=self.max_output_tokens,
+            base_url=base_url,
+            http_client=make_http_client(),
+            http_async_client=make_async_http_client(),
+            model_kwargs=(
+                {"response_format": {"type": "json_object"}} if self.json_mode else {}
+            ),
         )
 
-    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+    def _build_messages(self, prompt: str, system_message: str = None) -> list:
         messages = []
         if system_message:
             messages.append(SystemMessage(content=system_message))
         messages.append(HumanMessage(content=prompt))
+        return messages
 
-        response = self.llm.invoke(messages)
+    def _get_llm_response(self, prompt: str, system_message: str = None) -> str:
+        response = self.llm.invoke(self._build_messages(prompt, system_message))
         return response.content
+
+    async def _aget_llm_response(self, prompt: str, system_message: str = None) -> str:
+        response = await self.llm.ainvoke(self._build_messages(prompt, system_message))
+        return response.content
+
+    def _stream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> Iterator[str]:
+        for chunk in self.llm.stream(self._build_messages(prompt, system_message)):
+            yield chunk.content
+
+    async def _astream_llm_response(
+        self, prompt: str, system_message: str = None
+    ) -> AsyncIterator[str]:
+        async for chunk in self.llm.astream(
+            self._build_messages(prompt, system_message)
+        ):
+            yield chunk.content
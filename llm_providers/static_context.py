@@ -0,0 +1,32 @@
+# providers/static_context.py
+from dataclasses import dataclass, field
+from functools import cached_property
+
+from .tokens import count_tokens
+
+
+@dataclass(frozen=True)
+class StaticContext:
+    """
+    Prompt prefix that is identical across calls, e.g. the system message
+    with the resume and output instructions.
+
+    It is sent as the system message ahead of the per-call prompt, so
+    OpenAI and Ollama can reuse it through their prompt-prefix (KV) caches.
+    Gemini takes it as a model's system instruction, which is still billed
+    as input tokens on every call.
+    """
+
+    name: str
+    system_message: str
+    content: str
+    text: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "text", f"{self.system_message.strip()}\n\n{self.content.strip()}"
+        )
+
+    @cached_property
+    def tokens(self) -> int:
+        return count_tokens(self.text)
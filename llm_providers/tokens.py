@@ -0,0 +1,64 @@
+# providers/tokens.py
+import json
+from functools import lru_cache
+from typing import Any
+
+from loguru import logger
+
+# Rough characters per token used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding, None if it can't be loaded (e.g. offline)"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating token counts: {str(e)}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count (or estimate) the number of tokens in text"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """Trim text to at most budget tokens"""
+    if not text or budget <= 0:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[: budget * CHARS_PER_TOKEN]
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= budget:
+        return text
+    return encoding.decode(tokens[:budget])
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
+
+
+def _prune(data: Any) -> Any:
+    """Drop empty values that only cost tokens"""
+    if isinstance(data, dict):
+        pruned = {key: _prune(value) for key, value in data.items()}
+        return {key: value for key, value in pruned.items() if not _is_empty(value)}
+    if isinstance(data, list):
+        return [value for value in map(_prune, data) if not _is_empty(value)]
+    return data
+
+
+def compact_json(data: Any) -> str:
+    """Minified JSON representation of data without empty values"""
+    return json.dumps(_prune(data), separators=(",", ":"), ensure_ascii=False)
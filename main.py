@@ -1,13 +1,15 @@
 from typing import Dict
 import json
+import time
 from loguru import logger
+from AI import llm_parse_stats
 from config.settings import settings
-from core.browser_manager import BrowserManager
+from core.browser_pool import BrowserPool
 from core.queue_manager import JobQueue
-from core.url_processor import URLProcessor
 from sites.linkedin import LinkedInSite
 from sites.microsoft import MicrosoftSite
 from utils.logger import setup_logger
+from utils.metrics import metrics
 
 
 def load_credentials() -> Dict[str, Dict[str, str]]:
@@ -19,26 +21,26 @@ def load_credentials() -> Dict[str, Dict[str, str]]:
         raise
 
 
+def create_site_handlers(driver) -> Dict:
+    """Site handlers of one browser worker"""
+    return {
+        "linkedin": LinkedInSite(driver),
+        "microsoft": MicrosoftSite(driver),
+    }
+
+
 def main():
     setup_logger()
     logger.info("Starting job application bot")
+    run_start = time.perf_counter()
 
     # Initialize components
-    browser_manager = BrowserManager(headless=False)
+    browser_pool = BrowserPool(create_site_handlers)
     job_queue = JobQueue()
 
     try:
-        driver = browser_manager.init_driver()
         credentials = load_credentials()
 
-        # Initialize site handlers
-        site_handlers = {
-            "linkedin": LinkedInSite(driver),
-            "microsoft": MicrosoftSite(driver),
-        }
-
-        url_processor = URLProcessor(site_handlers)
-
         # Add jobs to queue
         # job_queue.add_url("microsoft.com")
         job_queue.add_url("linkedin.com")
@@ -49,18 +51,19 @@ def main():
         # Optional: Add jobs from file
         # job_queue.add_urls_from_file("job_urls.txt")
 
-        # Process all URLs in queue
-        #
-        while not job_queue.is_empty():
-            url = job_queue.get_next_url()
-            try:
-                url_processor.process_url(url, credentials)
-            except Exception as e:
-                logger.error(f"Error processing {url}: {str(e)}")
-                continue
+        # Process all URLs in queue across the browser workers
+        browser_pool.run(job_queue, credentials)
 
     finally:
-        browser_manager.quit()
+        browser_pool.quit()
+        # Workers run side by side, so time is summed over the URLs they
+        # processed rather than taken from the clock
+        metrics.log_summary(
+            run_seconds=metrics.total("url_seconds")
+            or time.perf_counter() - run_start
+        )
+        if parse_stats := llm_parse_stats():
+            logger.info(f"  LLM parse stats: {parse_stats}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,22 @@
 from abc import ABC, abstractmethod
 import json
-from typing import Dict, List, Optional, Type, TypeVar
-from httpcore import TimeoutException
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from loguru import logger
 from selenium import webdriver
 from core.exceptions import ApplicationException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from AI import get_answers, get_result
+from AI import get_answers, get_result, get_results_batch
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
     TimeoutException,
@@ -16,8 +25,108 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
 )
 from selenium.webdriver.remote.webelement import WebElement
+from utils.job_description import preprocess_description
+from utils.similarity import get_prefilter
+from config.settings import settings
 
 import os
+import threading
+import time
+
+from utils.metrics import metrics
+
+if TYPE_CHECKING:
+    from .discovery import JobDiscovery
+
+# Browser workers share the cookie and processed files
+_file_lock = threading.Lock()
+
+# Resolves true once the document is complete, its DOM has had no mutation
+# for quietMs, no fetch/XHR is in flight and selector (if any) matches, or
+# false after timeoutMs. The observers are installed once per document, so
+# later waits on the same page only cost the time the page actually needs.
+PAGE_READY_SCRIPT = """
+const [selector, quietMs, longRequestMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const state = window.__jobbotReady || (window.__jobbotReady = (() => {
+    const state = { lastActivity: performance.now(), requests: new Map(), next: 0 };
+    const touch = () => { state.lastActivity = performance.now(); };
+    const track = () => {
+        const id = state.next++;
+        state.requests.set(id, performance.now());
+        return () => { state.requests.delete(id); touch(); };
+    };
+    new MutationObserver(touch).observe(document, { childList: true, subtree: true });
+    if (window.PerformanceObserver) {
+        new PerformanceObserver(touch).observe({ entryTypes: ["resource"] });
+    }
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function (...args) {
+            const finish = track();
+            return fetch.apply(this, args).finally(finish);
+        };
+    }
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        this.addEventListener("loadend", track(), { once: true });
+        return send.apply(this, args);
+    };
+    return state;
+})());
+const start = performance.now();
+const check = () => {
+    const now = performance.now();
+    const busy = Array.from(state.requests.values())
+        .some((started) => now - started < longRequestMs);
+    if (document.readyState === "complete"
+        && !busy
+        && now - state.lastActivity >= quietMs
+        && (!selector || document.querySelector(selector))) {
+        return done(true);
+    }
+    if (now - start >= timeoutMs) return done(false);
+    setTimeout(check, 50);
+};
+check();
+"""
+
+# Resolves [index, elements] of the first CSS selector with a match under
+# root (the document if null), polling in the browser for up to timeoutMs,
+# or [-1, []] when none matched
+FIND_FIRST_OF_SCRIPT = """
+const [root, selectors, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const scope = root || document;
+const start = performance.now();
+const probe = () => {
+    for (let i = 0; i < selectors.length; i++) {
+        const found = scope.querySelectorAll(selectors[i]);
+        if (found.length) return done([i, Array.from(found)]);
+    }
+    if (performance.now() - start >= timeoutMs) return done([-1, []]);
+    setTimeout(probe, 50);
+};
+probe();
+"""
+
+
+def _probe_selectors(
+    driver: webdriver.Firefox,
+    root: Optional[WebElement],
+    selectors: List[str],
+    timeout: float,
+) -> Tuple[Optional[int], List["WebElementMod"]]:
+    try:
+        index, elements = driver.execute_async_script(
+            FIND_FIRST_OF_SCRIPT, root, list(selectors), int(timeout * 1000)
+        )
+    except Exception as e:
+        logger.debug(f"Error probing selectors {selectors}: {str(e)}")
+        return None, []
+    if index < 0:
+        return None, []
+    return index, [WebElementMod(element) for element in elements]
 
 
 class BaseSite(ABC):
@@ -49,59 +158,66 @@ class BaseSite(ABC):
         """Check if user is currently logged in"""
         pass
 
-    def wait_for_page_load(self, timeout=5, check_network=True, check_jquery=True):
+    def wait_for_page_load(
+        self, timeout=None, check_network=True, check_jquery=True
+    ):
         """
         Comprehensive page load waiting with multiple checks
 
         Args:
-            timeout (int): Maximum wait time in seconds
+            timeout (float): Maximum wait time in seconds, defaults to
+                settings.PAGE_READY_TIMEOUT
             check_network (bool): Whether to check network requests
-            check_jquery (bool): Whether to check jQuery ajax requests
+            check_jquery (bool): Whether to check jQuery ajax requests, these
+                go through XHR and are covered by the network check
         """
-        try:
-            # Wait for document ready state
-            self.wait_for_document_ready(timeout)
-
-            if check_jquery:
-                self.wait_for_jquery(timeout)
-
-            if check_network:
-                self.wait_for_network_idle(timeout)
-
-            # Wait for common loading indicators to disappear
-            # self.wait_for_loading_elements(timeout)
-
-            return True
-
-        except TimeoutException as e:
-            print(f"Timeout waiting for page load: {str(e)}")
-            return False
-        except Exception as e:
-            print(f"Error waiting for page load: {str(e)}")
-            return False
-
-    def wait_for_document_ready(self, timeout=30):
-        """Wait for document.readyState to be complete"""
-        self.wait.until(
-            lambda driver: driver.execute_script("return document.readyState")
-            == "complete"
+        return self.wait_until_ready(
+            timeout=timeout, check_network=check_network or check_jquery
         )
 
-    def wait_for_jquery(self, timeout=30):
-        """Wait for jQuery ajax requests to complete"""
-        jquery_check = """
-            return (typeof jQuery !== 'undefined' && jQuery.active === 0) ||
-                   typeof jQuery === 'undefined';
+    def wait_until_ready(
+        self,
+        selector: Optional[str] = None,
+        timeout: Optional[float] = None,
+        check_network: bool = True,
+    ) -> bool:
         """
-        self.wait.until(lambda driver: driver.execute_script(jquery_check))
+        Wait in the browser until the page is ready, see PAGE_READY_SCRIPT.
 
-    def wait_for_network_idle(self, timeout=30):
-        """Wait for network requests to complete"""
-        network_check = """
-            return window.performance.getEntriesByType('resource')
-                .filter(r => !r.responseEnd).length === 0;
+        Args:
+            selector: CSS selector that has to match before the page is ready
+            timeout: Maximum wait time in seconds, defaults to
+                settings.PAGE_READY_TIMEOUT
+            check_network: Whether in-flight requests keep the page busy
+        Returns:
+            bool: False if the page was not ready within the timeout
         """
-        self.wait.until(lambda driver: driver.execute_script(network_check))
+        if timeout is None:
+            timeout = settings.PAGE_READY_TIMEOUT
+        start = time.perf_counter()
+        deadline = start + timeout
+        ready = False
+        while (remaining := deadline - time.perf_counter()) > 0:
+            try:
+                ready = self.driver.execute_async_script(
+                    PAGE_READY_SCRIPT,
+                    selector,
+                    settings.PAGE_QUIET_MS,
+                    settings.PAGE_LONG_REQUEST_MS if check_network else 0,
+                    int(remaining * 1000),
+                )
+                break
+            except Exception as e:
+                # The document was replaced while waiting, wait on the new one
+                logger.debug(f"Page changed while waiting for it: {str(e)}")
+                time.sleep(0.1)
+
+        metrics.observe(
+            "page_ready_seconds", time.perf_counter() - start, ready=bool(ready)
+        )
+        if not ready:
+            logger.debug(f"Page not ready after {timeout}s")
+        return bool(ready)
 
     def wait_for_loading_elements(self, timeout=30):
         """Wait for common loading indicators to disappear"""
@@ -123,23 +239,117 @@ class BaseSite(ABC):
             except Exception as e:
                 continue  # Continue if selector not found
 
-    def get_answers(self):
+    def get_answers(self, questions: Optional[List[dict]] = None) -> Optional[dict]:
+        """
+        Get answers for the given questions, or for the queued self.questions
+        in which case they are stored in self.response_data
+        """
+        if questions is not None:
+            return get_answers(questions)
+
         list_ans = get_answers(self.questions)["answers"]
         for i, ques in enumerate(self.questions):
             self.response_data[ques["question"]] = list_ans[i]
 
+    def _check_match(self, result: Optional[dict]) -> Optional[dict]:
+        """Return the result if its matching percent clears the threshold"""
+        if result and "matching_percent" in result:
+            result["matching_percent"] = int(
+                str(result["matching_percent"]).replace("%", "")
+            )
+
+            return (
+                result
+                if result["matching_percent"] > settings.MATCH_THRESHOLD
+                else None
+            )
+
     def get_match_report(self, description):
         try:
+            description = preprocess_description(description)
+            if not get_prefilter().is_candidate(description):
+                return None
             result = get_result(description, self.site_type)
-            if "matching_percent" in result:
-                result["matching_percent"] = int(
-                    str(result["matching_percent"]).replace("%", "")
-                )
-
-                return result if result["matching_percent"] > 75 else None
+            return self._check_match(result)
         except Exception as e:
             logger.error(f"Error getting match report for {self.site_type}: {str(e)}")
 
+    def get_match_reports(self, descriptions: List[str]) -> List[Optional[dict]]:
+        """Score several job descriptions with batched LLM calls"""
+        reports = [None] * len(descriptions)
+        descriptions = [preprocess_description(text) for text in descriptions]
+        candidates = [
+            i
+            for i, description in enumerate(descriptions)
+            if get_prefilter().is_candidate(description)
+        ]
+        if not candidates:
+            return reports
+        try:
+            results = get_results_batch(
+                [descriptions[i] for i in candidates], self.site_type
+            )
+        except Exception as e:
+            logger.error(f"Error getting match reports for {self.site_type}: {str(e)}")
+            return reports
+
+        for i, result in zip(candidates, results):
+            try:
+                reports[i] = self._check_match(result)
+            except Exception as e:
+                logger.error(f"Invalid match report for {self.site_type}: {str(e)}")
+        return reports
+
+    def find_jobs(self, search: str) -> Generator[str, None, None]:
+        """
+        Urls of the jobs of a search that match the resume, without applying,
+        so that the browser pool can apply to them on any worker
+        """
+        yield from self.get_all_jobs(search, open_jobs=False)
+
+    def _discover_jobs(
+        self,
+        discovery_class: Type["JobDiscovery"],
+        processed: Set[str],
+        open_jobs: bool = True,
+    ) -> Generator:
+        """
+        Find and score jobs over HTTP, with the cookies of the browser, and
+        open only the matching ones in the browser
+
+        Args:
+            discovery_class: JobDiscovery of the site
+            processed: Job ids or urls to skip
+            open_jobs: Open each match in the browser, or only yield its url
+        """
+        discovery = discovery_class(
+            cookies=self.get_cookies() or self.driver.get_cookies(),
+            user_agent=self.driver.execute_script("return navigator.userAgent"),
+        )
+        try:
+            for jobs in discovery.pages():
+                jobs = discovery.fetch_descriptions(
+                    [
+                        job
+                        for job in jobs
+                        if job.job_id not in processed and job.url not in processed
+                    ]
+                )
+                matches = self.get_match_reports([job.description for job in jobs])
+                for job, match in zip(jobs, matches):
+                    if not match:
+                        self.save_processed(job.url)
+                        continue
+                    logger.info(f"{job.title} at {job.company} matches: {match}")
+                    if not open_jobs:
+                        yield job.url
+                        continue
+                    self.driver.get(job.url)
+                    self.wait_for_page_load()
+                    yield job
+        finally:
+            discovery.close()
+
     def _get_element(self, by: By, selector: str, timeout: int = 0.5) -> Optional[any]:
         """Safe element getter with wait"""
         try:
@@ -160,6 +370,21 @@ class BaseSite(ABC):
             print(f"Error getting elements {str(e)}")
             return []
 
+    def _find_first_of(
+        self, selectors: List[str], timeout: float = 0.5
+    ) -> Tuple[Optional[int], List["WebElementMod"]]:
+        """
+        Probe several CSS selectors in a single browser call
+
+        Args:
+            selectors: CSS selectors in order of preference
+            timeout: Maximum wait time in seconds, 0 checks once
+        Returns:
+            Index of the first selector with a match and its elements, or
+            (None, []) if none matched
+        """
+        return _probe_selectors(self.driver, None, selectors, timeout)
+
     def _safe_click(self, element) -> bool:
         """Safely click an element with multiple attempts"""
         if not element:
@@ -194,29 +419,33 @@ class BaseSite(ABC):
 
     def save_cookies(self) -> None:
         """Save current cookies"""
-        try:
-            with open(self.COOKIE_FILE, "r") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
+        cookies = self.driver.get_cookies()
+        with _file_lock:
+            try:
+                with open(self.COOKIE_FILE, "r") as f:
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = {}
 
-        data[self.site_type] = self.driver.get_cookies()
+            data[self.site_type] = cookies
 
-        with open(self.COOKIE_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+            with open(self.COOKIE_FILE, "w") as f:
+                json.dump(data, f, indent=2)
 
-    def save_processed(self) -> None:
-        """Save current cookies"""
-        try:
-            with open(self.PROCESSED_FILE, "r") as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
+    def save_processed(self, url: Optional[str] = None) -> None:
+        """Save a url, the current one by default, as processed"""
+        current_url = url or self.driver.current_url
+        with _file_lock:
+            try:
+                with open(self.PROCESSED_FILE, "r") as f:
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = {}
 
-        data[self.driver.current_url] = True
+            data[current_url] = True
 
-        with open(self.PROCESSED_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+            with open(self.PROCESSED_FILE, "w") as f:
+                json.dump(data, f, indent=2)
 
     def add_cookies(self):
         """Add a cookie to the browser"""
@@ -271,3 +500,9 @@ class WebElementMod(WebElement):
             return [WebElementMod(element) for element in elements] if elements else []
         except Exception as e:
             return []
+
+    def _find_first_of(
+        self, selectors: List[str], timeout: float = 0.5
+    ) -> Tuple[Optional[int], List["WebElementMod"]]:
+        """Probe several CSS selectors within this element in one call"""
+        return _probe_selectors(self._parent, self, selectors, timeout)
@@ -0,0 +1,305 @@
+# sites/discovery.py
+"""
+Job discovery over plain HTTP.
+
+Listing pages and job descriptions are fetched through one pooled
+keep-alive client that carries the browser's cookies, and parsed in
+Python. The browser is then only needed to apply.
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+from loguru import logger
+
+from config.settings import settings
+from core.exceptions import DiscoveryException
+from utils.metrics import metrics
+
+# Tags that end a line when HTML is turned into text
+BLOCK_TAGS = {
+    "br",
+    "div",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "li",
+    "ol",
+    "p",
+    "tr",
+    "ul",
+}
+VOID_TAGS = {"br", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+
+@dataclass
+class DiscoveredJob:
+    job_id: str
+    url: str  # page the browser opens to apply
+    title: str = ""
+    company: str = ""
+    description: str = ""
+
+
+def make_discovery_client(
+    cookies: Optional[List[Dict]] = None, user_agent: Optional[str] = None
+) -> httpx.Client:
+    """Keep-alive client carrying the browser's cookies (as stored by Selenium)"""
+    jar = httpx.Cookies()
+    for cookie in cookies or []:
+        jar.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    limits = httpx.Limits(
+        max_connections=settings.DISCOVERY_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.DISCOVERY_MAX_CONNECTIONS,
+    )
+    headers = {"User-Agent": user_agent} if user_agent else None
+    return httpx.Client(
+        cookies=jar,
+        headers=headers,
+        limits=limits,
+        timeout=settings.DISCOVERY_HTTP_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+class _TextParser(HTMLParser):
+    """Visible text of an HTML document, or of its first root_class element"""
+
+    def __init__(self, root_class: Optional[str] = None):
+        super().__init__()
+        self.root_class = root_class
+        self.inside = root_class is None
+        self.done = False
+        self.depth = 0  # open elements inside the root
+        self.hidden = 0  # open script and style elements
+        self.lines: List[str] = [""]
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if not self.inside:
+            if self.root_class in (dict(attrs).get("class") or "").split():
+                self.inside, self.depth = True, 1
+            return
+        if tag not in VOID_TAGS:
+            self.depth += 1
+        if tag in ("script", "style"):
+            self.hidden += 1
+        if tag in BLOCK_TAGS:
+            self.lines.append("")
+
+    def handle_endtag(self, tag):
+        if not self.inside or self.done:
+            return
+        if tag in ("script", "style"):
+            self.hidden -= 1
+        if tag in BLOCK_TAGS:
+            self.lines.append("")
+        self.depth -= 1
+        if self.root_class is not None and self.depth == 0:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.inside and not self.done and not self.hidden:
+            self.lines[-1] += data
+
+    @property
+    def text(self) -> str:
+        lines = (" ".join(line.split()) for line in self.lines)
+        return "\n".join(line for line in lines if line)
+
+
+def html_to_text(html: str, root_class: Optional[str] = None) -> str:
+    """Text of html with one line per block element"""
+    parser = _TextParser(root_class)
+    parser.feed(html or "")
+    parser.close()
+    return parser.text
+
+
+class JobDiscovery(ABC):
+    """Lists the jobs of a site and reads their descriptions over HTTP"""
+
+    SITE: str
+    BASE_URL: str
+    MAX_PAGES: int
+
+    def __init__(
+        self,
+        cookies: Optional[List[Dict]] = None,
+        base_url: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        client: Optional[httpx.Client] = None,
+    ):
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.client = client or make_discovery_client(cookies, user_agent)
+
+    @abstractmethod
+    def fetch_page(self, page: int) -> List[DiscoveredJob]:
+        """Jobs of a listing page, an empty list past the last page"""
+        pass
+
+    @abstractmethod
+    def fetch_description(self, job: DiscoveredJob) -> str:
+        """Plain text description of a job"""
+        pass
+
+    def _get(self, path: str) -> httpx.Response:
+        try:
+            with metrics.timer("discovery_request_seconds", site=self.SITE):
+                response = self.client.get(f"{self.base_url}{path}")
+            response.raise_for_status()
+            return response
+        except httpx.HTTPError as e:
+            metrics.inc("discovery_errors", site=self.SITE)
+            raise DiscoveryException(f"Failed to fetch {path}: {str(e)}")
+
+    def _read_description(self, job: DiscoveredJob) -> DiscoveredJob:
+        try:
+            job.description = self.fetch_description(job)
+        except DiscoveryException as e:
+            logger.warning(str(e))
+        return job
+
+    def fetch_descriptions(self, jobs: List[DiscoveredJob]) -> List[DiscoveredJob]:
+        """
+        Read the descriptions of jobs concurrently over the pooled
+        connections, jobs whose description could not be read are dropped
+        """
+        with ThreadPoolExecutor(settings.DISCOVERY_MAX_CONNECTIONS) as executor:
+            jobs = list(executor.map(self._read_description, jobs))
+        return [job for job in jobs if job.description]
+
+    def pages(self) -> Iterator[List[DiscoveredJob]]:
+        """
+        Listing pages until the first empty one. An empty first page means
+        the listing couldn't be read (changed markup, auth wall, rate limit
+        page), so it raises DiscoveryException for the browser to take over
+        """
+        for page in range(self.MAX_PAGES):
+            jobs = self.fetch_page(page)
+            if not jobs:
+                if page == 0:
+                    metrics.inc("discovery_errors", site=self.SITE)
+                    raise DiscoveryException(f"No jobs on the first {self.SITE} page")
+                return
+            metrics.inc("discovery_jobs", len(jobs), site=self.SITE)
+            yield jobs
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class _LinkedInCardParser(HTMLParser):
+    """Job cards of a LinkedIn guest search results fragment"""
+
+    FIELDS = {
+        "base-search-card__title": "title",
+        "base-search-card__subtitle": "company",
+    }
+
+    def __init__(self, job_url: str):
+        super().__init__()
+        self.job_url = job_url
+        self.jobs: List[DiscoveredJob] = []
+        self.field: Optional[str] = None
+        self.field_tag: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        urn = attrs.get("data-entity-urn") or ""
+        if urn.startswith("urn:li:jobPosting:"):
+            job_id = urn.rsplit(":", 1)[-1]
+            self.jobs.append(DiscoveredJob(job_id, self.job_url.format(job_id)))
+            return
+        for class_name in (attrs.get("class") or "").split():
+            if self.jobs and class_name in self.FIELDS:
+                self.field, self.field_tag = self.FIELDS[class_name], tag
+
+    def handle_endtag(self, tag):
+        if tag == self.field_tag:
+            self.field = self.field_tag = None
+
+    def handle_data(self, data):
+        if self.field:
+            job = self.jobs[-1]
+            text = f"{getattr(job, self.field)} {data}"
+            setattr(job, self.field, " ".join(text.split()))
+
+
+class LinkedInDiscovery(JobDiscovery):
+    """Easy Apply jobs from LinkedIn's guest job search endpoints"""
+
+    SITE = "linkedin"
+    BASE_URL = "https://www.linkedin.com"
+    JOB_URL = "https://www.linkedin.com/jobs/view/{}/"
+    SEARCH_PATH = (
+        "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        "?f_AL=true&geoId=102713980&f_TPR=r86400&start={}"
+    )
+    JOB_PATH = "/jobs-guest/jobs/api/jobPosting/{}"
+    PAGE_SIZE = 25
+    MAX_PAGES = 21
+
+    def fetch_page(self, page: int) -> List[DiscoveredJob]:
+        response = self._get(self.SEARCH_PATH.format(page * self.PAGE_SIZE))
+        parser = _LinkedInCardParser(self.JOB_URL)
+        parser.feed(response.text)
+        parser.close()
+        return parser.jobs
+
+    def fetch_description(self, job: DiscoveredJob) -> str:
+        response = self._get(self.JOB_PATH.format(job.job_id))
+        return html_to_text(response.text, "show-more-less-html__markup")
+
+
+class MicrosoftDiscovery(JobDiscovery):
+    """Jobs from the search API behind the Microsoft careers site"""
+
+    SITE = "microsoft"
+    BASE_URL = "https://gcsservices.careers.microsoft.com/search/api/v1"
+    JOB_URL = "https://jobs.careers.microsoft.com/global/en/job/{}"
+    SEARCH_PATH = (
+        "/search?lc=India&d=Software%20Engineering&l=en_us&pgSz=20&o=Recent&pg={}"
+    )
+    JOB_PATH = "/job/{}?lang=en_us"
+    MAX_PAGES = 20
+
+    def _result(self, path: str) -> Dict:
+        try:
+            return self._get(path).json()["operationResult"]["result"] or {}
+        except (ValueError, KeyError, TypeError) as e:
+            raise DiscoveryException(f"Unexpected response for {path}: {str(e)}")
+
+    def fetch_page(self, page: int) -> List[DiscoveredJob]:
+        jobs = self._result(self.SEARCH_PATH.format(page + 1)).get("jobs") or []
+        return [
+            DiscoveredJob(
+                job_id=str(job["jobId"]),
+                url=self.JOB_URL.format(job["jobId"]),
+                title=job.get("title", ""),
+                company="Microsoft",
+            )
+            for job in jobs
+            if job.get("jobId")
+        ]
+
+    def fetch_description(self, job: DiscoveredJob) -> str:
+        result = self._result(self.JOB_PATH.format(job.job_id))
+        sections = [
+            html_to_text(result.get(name) or "")
+            for name in ("description", "responsibilities", "qualifications")
+        ]
+        return "\n".join(section for section in sections if section)
@@ -1,25 +1,24 @@
 import datetime
-import json
+import re
 import time
-from typing import Optional, Generator
+from typing import List, Optional, Generator, Set
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.common.exceptions import (
-    NoSuchElementException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
+    NoSuchElementException,
 )
 from .base_site import BaseSite, WebElementMod
-from core.exceptions import ApplicationException
+from config.settings import settings
+from core.exceptions import ApplicationException, DiscoveryException
 from loguru import logger
 from urllib.parse import urlparse, parse_qs
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from utils.metadata_index import get_metadata_index
 from utils.utilities import extract_numbers, retry, timeout
 
 
-metadata = json.loads(open("data/metadata.json").read())
-
-
 @dataclass
 class Selectors:
     """Centralized selectors for LinkedIn"""
@@ -32,6 +31,8 @@ class Selectors:
     APPLICATION = {
         "jobs_list_item": "jobs-search-results__list-item",  # class
         "job_card": "job-card-container--clickable",  # class
+        "job_title": ".job-card-list__title, .job-card-list__title--link",  # css
+        "job_company": ".artdeco-entity-lockup__subtitle",  # css
         "easy_apply_div": "jobs-apply-button--top-card",  # class
         "submit_application": 'button[aria-label="Submit application"]',  # css
         "next_btn": "button[aria-label='Continue to next step']",  # css
@@ -51,6 +52,123 @@ class Selectors:
     }
 
 
+# Reads every job card of a search results page in one round trip. Cards
+# LinkedIn has not rendered yet still carry their job id on the list item,
+# which also locates the card again after a re-render or a reload.
+JOB_CARDS_SCRIPT = """
+const [itemClass, cardClass, titleSelector, companySelector] = arguments;
+const text = (el) => (el ? (el.innerText || el.textContent || "").trim() : "");
+return Array.from(document.getElementsByClassName(itemClass), (item) => {
+    const card = item.getElementsByClassName(cardClass)[0];
+    const itemId = item.getAttribute("data-occludable-job-id");
+    return {
+        job_id: itemId || (card && card.getAttribute("data-job-id")) || "",
+        title: text(item.querySelector(titleSelector)),
+        company: text(item.querySelector(companySelector)),
+        applied: text(card).includes("Applied"),
+        locator: itemId ? `[data-occludable-job-id="${itemId}"]` : "",
+    };
+});
+"""
+
+# Collects every field of the current Easy Apply step in one round trip. Each
+# field (and fieldset option) is tagged with a data attribute to locate it by.
+FORM_SNAPSHOT_SCRIPT = """
+const [modalSelector, sectionClass] = arguments;
+const modal = document.querySelector(modalSelector);
+if (!modal) return [];
+const text = (el) => (el ? el.innerText || el.textContent || "" : "");
+const siblingText = (section) => {
+    const prev = section.previousElementSibling;
+    return text(prev && prev.previousElementSibling) + text(prev);
+};
+const fields = [];
+for (const group of modal.querySelectorAll(".pb4")) {
+    const heading = group.querySelector("h3");
+    if (heading && text(heading).trim() === "Resume") continue;
+    for (const section of group.getElementsByClassName(sectionClass)) {
+        const index = fields.length;
+        const fieldset = section.querySelector("fieldset");
+        const control = fieldset
+            || section.querySelector("input")
+            || section.querySelector("textarea")
+            || section.querySelector("select");
+        if (!control) continue;
+        control.setAttribute("data-jobbot-field", index);
+
+        const label = fieldset
+            ? section.querySelector("legend")
+            : section.querySelector("label");
+        const field = {
+            question: label ? text(label) : siblingText(section),
+            kind: control.tagName.toLowerCase(),
+            locator: `[data-jobbot-field="${index}"]`,
+            required: !!control.required,
+            value: control.value || "",
+            input_type: control.type || "",
+            autocomplete: control.getAttribute("aria-autocomplete") || "",
+            options: [],
+        };
+        if (fieldset) {
+            fieldset.querySelectorAll("label").forEach((option, i) => {
+                option.setAttribute("data-jobbot-option", `${index}-${i}`);
+                field.options.push(text(option));
+            });
+        } else if (field.kind === "select") {
+            field.options = Array.from(control.options, (option) => option.value);
+        }
+        fields.push(field);
+    }
+}
+return fields;
+"""
+
+# Validation message of a field's section, polling in the browser for up to
+# timeoutMs since some errors (date or number formats) render asynchronously
+FIELD_ERROR_SCRIPT = """
+const [field, sectionClass, errorClass, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const section = field.closest("." + sectionClass);
+const start = performance.now();
+const probe = () => {
+    const error = section && section.getElementsByClassName(errorClass)[0];
+    if (error) return done(error.innerText || error.textContent || "");
+    if (!section || performance.now() - start >= timeoutMs) return done(null);
+    setTimeout(probe, 50);
+};
+probe();
+"""
+
+
+@dataclass
+class JobCard:
+    """A job of the search results page, as captured by JOB_CARDS_SCRIPT"""
+
+    job_id: str
+    title: str
+    company: str
+    applied: bool
+    locator: str  # css selector of the list item, empty without a job id
+
+
+@dataclass
+class FormField:
+    """A field of the current Easy Apply step, as captured by FORM_SNAPSHOT_SCRIPT"""
+
+    question: str
+    kind: str  # fieldset, input, textarea or select
+    locator: str  # css selector of the field
+    required: bool = False
+    value: str = ""
+    input_type: str = ""
+    autocomplete: str = ""
+    options: List[str] = field(default_factory=list)
+
+    def option_locator(self, index: int) -> str:
+        field_index = self.locator.split('"')[1]
+        return f'[data-jobbot-option="{field_index}-{index}"]'
+
+
 class LinkedInSite(BaseSite):
     BASE_URL = "https://www.linkedin.com"
     LOGIN_URL = f"{BASE_URL}/login"
@@ -135,72 +253,170 @@ class LinkedInSite(BaseSite):
                 logger.error(f"Error applying to job: {str(e)}")
             finally:
                 try:
-                    if close_button := self._get_element(
-                        By.CSS_SELECTOR, self.selectors.APPLICATION["close_btn"]
-                    ):
+                    _, close_buttons = self._find_first_of(
+                        [self.selectors.APPLICATION["close_btn"]]
+                    )
+                    if close_button := next(iter(close_buttons), None):
                         close_button.click()
                 except ElementClickInterceptedException:
                     self._safe_click(close_button)
                 except Exception as e:
                     logger.info("Unable to close the modal")
 
-                if modal := self._get_element(
-                    By.CSS_SELECTOR, self.selectors.APPLICATION["form"]["modal"]
-                ):
+                _, modal = self._find_first_of(
+                    [self.selectors.APPLICATION["form"]["modal"]]
+                )
+                if modal:
                     self.driver.refresh()
                 self.response_data = {}
 
-    def get_all_jobs(self, job_url: str) -> Generator:
-        """Get all matching jobs from LinkedIn"""
+    def get_all_jobs(self, job_url: str, open_jobs: bool = True) -> Generator:
+        """
+        Get all matching jobs from LinkedIn, opened in the browser or, with
+        open_jobs=False, as job urls
+        """
         if urlparse(job_url).netloc:
-            self.driver.get(job_url)
+            if open_jobs:
+                self.driver.get(job_url)
             yield job_url
             return
 
+        if settings.DISCOVERY_HTTP:
+            from .discovery import LinkedInDiscovery
+
+            try:
+                yield from self._discover_jobs(
+                    LinkedInDiscovery, self._processed_job_ids(), open_jobs
+                )
+                return
+            except DiscoveryException as e:
+                logger.warning(f"HTTP job discovery failed, using the browser: {e}")
+
         base_url = "https://www.linkedin.com/jobs/search/"
         params = "?f_AL=true&geoId=102713980&f_TPR=r86400"
 
         for page in range(21):
             try:
                 self.driver.get(f"{base_url}{params}&start={page*25}")
-                job_card = self._get_element(
+                self._get_element(
                     By.CLASS_NAME, self.selectors.APPLICATION["jobs_list_item"], 5
                 )
-                job_cards = self._get_elements(
-                    By.CLASS_NAME, self.selectors.APPLICATION["jobs_list_item"]
-                )
-                card_number = 0
-                while card_number < 25:
+                job_cards = self._pending_job_cards()
+
+                # Read every description on the page first so they can be
+                # scored with a single batched LLM call
+                descriptions = {}
+                for card_number, card in enumerate(job_cards):
                     try:
-                        job = self._process_job_card(job_cards[card_number])
-                        if job:
-                            yield job
-                        card_number += 1
-                    except StaleElementReferenceException as e:
-                        logger.error("Stale element reference exception")
-                        job_cards = self._get_elements(
-                            By.CLASS_NAME, self.selectors.APPLICATION["jobs_list_item"]
-                        )
+                        description = self._read_job_card(card)
+                        if description:
+                            descriptions[card_number] = description
                     except Exception as e:
                         logger.error(f"Error processing job card: {str(e)}")
+
+                matches = self.get_match_reports(list(descriptions.values()))
+                for card_number, match in zip(descriptions, matches):
+                    card = job_cards[card_number]
+                    if not match:
+                        if card.job_id:
+                            self.save_processed(self._job_url(card.job_id))
+                        continue
+                    if not open_jobs:
+                        logger.info(f"Matching percentage is {match}%")
+                        yield self._job_url(card.job_id)
                         continue
+                    try:
+                        job = self._open_job_card(card)
+                    except Exception as e:
+                        logger.error(f"Error opening job card: {str(e)}")
+                        continue
+                    if job:
+                        logger.info(f"Matching percentage is {match}%")
+                        yield job
 
             except Exception as e:
                 logger.warning(f"Error on page {page}: {str(e)}")
 
-    def _process_job_card(self, card: WebElementMod) -> Optional[WebElementMod]:
-        """Process a single job card"""
+    def _job_url(self, job_id: str) -> str:
+        return f"{self.BASE_URL}/jobs/view/{job_id}/"
+
+    def _snapshot_job_cards(self) -> List[JobCard]:
+        """Describe every job card of the results page with a single script call"""
+        cards = self.driver.execute_script(
+            JOB_CARDS_SCRIPT,
+            self.selectors.APPLICATION["jobs_list_item"],
+            self.selectors.APPLICATION["job_card"],
+            self.selectors.APPLICATION["job_title"],
+            self.selectors.APPLICATION["job_company"],
+        )
+        return [JobCard(**data) for data in cards or []]
+
+    def _processed_job_ids(self) -> Set[str]:
+        """Job ids of the LinkedIn urls in the processed file"""
+        job_ids = set()
+        for url in self.get_processed or {}:
+            parsed_url = urlparse(url)
+            if job_id := parse_qs(parsed_url.query).get("currentJobId", [None])[0]:
+                job_ids.add(job_id)
+            elif match := re.search(r"/jobs/view/(\d+)", parsed_url.path):
+                job_ids.add(match.group(1))
+        return job_ids
+
+    def _pending_job_cards(self) -> List[JobCard]:
+        """Job cards of the page, without applied and already processed jobs"""
+        job_cards = self._snapshot_job_cards()[:25]
+        processed = self._processed_job_ids()
+        pending = [
+            card
+            for card in job_cards
+            if not card.applied and card.job_id not in processed
+        ]
+        logger.info(
+            f"{len(pending)} of {len(job_cards)} job cards left after skipping "
+            "applied and processed jobs"
+        )
+        return pending
+
+    def _scroll_to_job_card(self, card: JobCard) -> Optional[WebElementMod]:
+        item = self._field_element(card.locator)
+        self.driver.execute_script("arguments[0].scrollIntoView();", item)
+        return item._get_element(By.CLASS_NAME, self.selectors.APPLICATION["job_card"])
+
+    def _current_job_id(self) -> Optional[str]:
+        """Job id of the job shown next to the results list"""
+        query = parse_qs(urlparse(self.driver.current_url).query)
+        return query.get("currentJobId", [None])[0]
+
+    def _open_job_card(self, card: JobCard) -> Optional[WebElementMod]:
+        """Scroll to a job card and open it, None unless that job is shown"""
+        if not card.locator:
+            return None
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView();", card)
-            job_card = card._get_element(
-                By.CLASS_NAME, self.selectors.APPLICATION["job_card"]
-            )
+            job_card = self._scroll_to_job_card(card)
+        except (StaleElementReferenceException, NoSuchElementException):
+            # The list was re-rendered or the page reloaded (e.g. after closing
+            # an application), wait for the card to come back and retry once
+            self._get_element(By.CSS_SELECTOR, card.locator, 5)
+            job_card = self._scroll_to_job_card(card)
+
+        if not job_card:
+            return None
+        # Only cards LinkedIn rendered after scrolling still need the check
+        if not card.title and "Applied" in job_card.text:
+            return None
 
-            if "Applied" in job_card.text:
-                return None
+        self._safe_click(job_card)
+        self.wait_for_page_load()
+        if (opened := self._current_job_id()) and opened != card.job_id:
+            logger.warning(f"Opened job {opened} instead of job card {card.job_id}")
+            return None
+        return job_card
 
-            self._safe_click(job_card)
-            self.wait_for_page_load()
+    def _read_job_card(self, card: JobCard) -> Optional[str]:
+        """Open a job card and return its description if it supports Easy Apply"""
+        try:
+            if not self._open_job_card(card):
+                return None
 
             if not (
                 job_description := self._get_element(
@@ -216,51 +432,47 @@ class LinkedInSite(BaseSite):
             ):
                 return None
 
-            match = self.get_match_report(job_description.text)
-            if not match:
-                return None
-            logger.info(f"Matching percentage is {match}%")
-            return job_card
-        except StaleElementReferenceException as e:
-            raise StaleElementReferenceException(
-                f"Stale element reference error: {str(e)}"
-            )
-
+            return job_description.text
         except Exception as e:
             logger.error(f"Error processing job card: {str(e)}")
             return None
 
-    def _handle_form_section(self, section: WebElementMod) -> None:
-        """Handle a single form section"""
+    def _snapshot_form(self) -> List[FormField]:
+        """Describe every field of the current step with a single script call"""
+        fields = self.driver.execute_script(
+            FORM_SNAPSHOT_SCRIPT,
+            self.selectors.APPLICATION["form"]["modal"],
+            self.selectors.APPLICATION["form"]["section"],
+        )
+        return [FormField(**data) for data in fields or []]
+
+    def _field_element(self, locator: str) -> WebElementMod:
+        return WebElementMod(self.driver.find_element(By.CSS_SELECTOR, locator))
+
+    def _field_error(
+        self, element: WebElementMod, timeout: float = 0.5
+    ) -> Optional[str]:
+        """Validation error shown for the field within timeout, None if there is none"""
+        return self.driver.execute_async_script(
+            FIELD_ERROR_SCRIPT,
+            element,
+            self.selectors.APPLICATION["form"]["section"],
+            self.selectors.APPLICATION["form"]["error"],
+            int(timeout * 1000),
+        )
+
+    def _handle_form_section(self, form_field: FormField) -> None:
+        """Handle a single form field"""
 
         try:
-            try:
-                question = section._get_element(By.TAG_NAME, "label").text
-            except NoSuchElementException as e:
-                question = (
-                    section._get_element(
-                        By.XPATH, "./preceding-sibling::*[2]").text
-                    + section._get_element(By.XPATH,
-                                           "./preceding-sibling::*[1]").text
-                )
-            if fieldsets := section._get_elements(By.TAG_NAME, "fieldset"):
-                try:
-                    question = section._get_element(By.TAG_NAME, "legend").text
-                except NoSuchElementException as e:
-                    question = (
-                        section._get_element(
-                            By.XPATH, "./preceding-sibling::*[2]").text
-                        + section._get_element(
-                            By.XPATH, "./preceding-sibling::*[1]"
-                        ).text
-                    )
-                self._handle_fieldset_field(fieldsets[0], question)
-            elif inputs := section._get_elements(By.TAG_NAME, "input"):
-                self._handle_input_field(inputs[0], question)
-            elif text_boxes := section._get_elements(By.TAG_NAME, "textarea"):
-                self._handle_text_box_field(text_boxes[0], question)
-            elif selects := section._get_elements(By.TAG_NAME, "select"):
-                self._handle_select_field(selects[0], question)
+            if form_field.kind == "fieldset":
+                self._handle_fieldset_field(form_field)
+            elif form_field.kind == "input":
+                self._handle_input_field(form_field)
+            elif form_field.kind == "textarea":
+                self._handle_text_box_field(form_field)
+            elif form_field.kind == "select":
+                self._handle_select_field(form_field)
 
         except Exception as e:
             logger.error(f"Error handling form section: {str(e)}")
@@ -281,7 +493,12 @@ class LinkedInSite(BaseSite):
 
             # Send keys to input field
             input_field.send_keys(answer_text)
-            time.sleep(1)  # Wait for autocomplete suggestions
+            # Wait for autocomplete suggestions
+            self.wait_until_ready(
+                selector="."
+                + self.selectors.APPLICATION["form"]["dropdown_options"],
+                timeout=1,
+            )
 
             # Update input value and trigger events
             self.driver.execute_script(
@@ -328,27 +545,32 @@ class LinkedInSite(BaseSite):
                     f"Fallback for autocomplete input failed: {str(e2)}")
                 return False
 
-    def _handle_input_field(self, input_field: WebElementMod, question: str) -> bool:
+    @staticmethod
+    def _metadata_answer(question: str) -> str:
+        """Answer from metadata.json for a similar enough question, or empty"""
+        answer = get_metadata_index().lookup(question)
+        return "" if answer is None else str(answer)
+
+    def _handle_input_field(self, form_field: FormField) -> bool:
         """Handle input field in form"""
+        question = form_field.question
         if self.response_data and question not in self.response_data:
             return True
         try:
             if (
-                input_field.get_attribute("value")
-                and input_field.get_attribute("value") != "1"
-            ) or not input_field.get_property("required"):
+                form_field.value and form_field.value != "1"
+            ) or not form_field.required:
                 return True
-            answer_text = metadata.get(question.replace("\n", "").lower(), "")
+            input_field = self._field_element(form_field.locator)
+            answer_text = self._metadata_answer(question)
             if not self.response_data and not answer_text:
                 self.questions.append({"question": question, "type": "text"})
                 try:
                     self._handle_autocomplete_input(input_field, "1")
                 except Exception as e:
                     input_field.send_keys(0)
-                if error := self._get_element(
-                    By.CLASS_NAME, self.selectors.APPLICATION["form"]["error"]
-                ):
-                    if "mm/dd/yyyy" in error.text:
+                if error := self._field_error(input_field):
+                    if "mm/dd/yyyy" in error:
                         date = datetime.datetime.now().strftime("%x")
                         input_field.send_keys(date)
                 return True
@@ -359,11 +581,11 @@ class LinkedInSite(BaseSite):
 
             if answer_text:
                 if (
-                    input_field.get_attribute("type")
+                    form_field.input_type
                     == self.selectors.APPLICATION["form"]["input_types"]["text"]
                 ):
                     if (
-                        input_field.get_attribute("aria-autocomplete")
+                        form_field.autocomplete
                         == self.selectors.APPLICATION["form"]["input_types"][
                             "autocomplete"
                         ]
@@ -372,15 +594,13 @@ class LinkedInSite(BaseSite):
                             input_field, answer_text)
                     else:
                         input_field.send_keys(answer_text)
-                if error := self._get_element(
-                    By.CLASS_NAME, self.selectors.APPLICATION["form"]["error"]
-                ):
+                if (error := self._field_error(input_field)) is not None:
                     input_field.clear()
 
-                    if "mm/dd/yyyy" in error.text:
+                    if "mm/dd/yyyy" in error:
                         date = datetime.datetime.now().strftime("%x")
                         input_field.send_keys(date)
-                    elif error.text:
+                    elif error:
                         input_field.send_keys(extract_numbers(answer_text))
                     else:
                         input_field.send_keys(0)
@@ -390,17 +610,18 @@ class LinkedInSite(BaseSite):
             logger.error(f"Error handling input field: {str(e)}")
         return False
 
-    def _handle_text_box_field(self, text_box: WebElementMod, question: str) -> bool:
+    def _handle_text_box_field(self, form_field: FormField) -> bool:
         """Handle input field in form"""
+        question = form_field.question
         if self.response_data and question not in self.response_data:
             return True
         try:
             if (
-                text_box.get_attribute("value")
-                and text_box.get_attribute("value") != "0"
-            ) or not text_box.get_property("required"):
+                form_field.value and form_field.value != "0"
+            ) or not form_field.required:
                 return True
-            answer_text = metadata.get(question.replace("\n", "").lower(), "")
+            text_box = self._field_element(form_field.locator)
+            answer_text = self._metadata_answer(question)
             if not self.response_data and not answer_text:
                 self.questions.append({"question": question, "type": "text"})
                 text_box.send_keys(0)
@@ -417,24 +638,24 @@ class LinkedInSite(BaseSite):
             logger.error(f"Error handling input field: {str(e)}")
         return False
 
-    def _handle_select_field(self, select_field: WebElementMod, question: str) -> bool:
+    def _handle_select_field(self, form_field: FormField) -> bool:
         """Handle select field in form"""
+        question = form_field.question
         try:
             if (
                 not self.response_data
-                and "select" not in select_field.get_attribute("value").lower()
+                and "select" not in form_field.value.lower()
             ):
                 return True
 
             if self.response_data and question not in self.response_data:
                 return True
 
-            options = select_field._get_elements(By.TAG_NAME, "option")
+            options = form_field.options
             clean_options = [
-                opt.get_attribute("value")
-                for opt in options
-                if opt.get_attribute("value") != "Select an option"
+                value for value in options if value != "Select an option"
             ]
+            select_field = Select(self._field_element(form_field.locator))
             if not self.response_data:
                 self.questions.append(
                     {"question": question, "type": "options",
@@ -442,10 +663,10 @@ class LinkedInSite(BaseSite):
                 )
                 for value in [
                     "Yes",
-                    options[-1].get_attribute("value"),
+                    options[-1],
                 ]:
                     try:
-                        Select(select_field).select_by_value(value)
+                        select_field.select_by_value(value)
                         return True
                     except Exception:
                         continue
@@ -455,10 +676,10 @@ class LinkedInSite(BaseSite):
                 for value in [
                     answer,
                     "Yes",
-                    options[1].get_attribute("value"),
+                    options[1],
                 ]:
                     try:
-                        Select(select_field).select_by_value(value)
+                        select_field.select_by_value(value)
                         return True
                     except Exception:
                         continue
@@ -467,32 +688,31 @@ class LinkedInSite(BaseSite):
             logger.error(f"Error handling select field: {str(e)}")
         return False
 
-    def _handle_fieldset_field(self, fieldset: WebElementMod, question: str) -> bool:
+    def _click_option(self, form_field: FormField, index: int) -> None:
+        self._field_element(form_field.option_locator(index)).click()
+
+    def _handle_fieldset_field(self, form_field: FormField) -> bool:
         """Handle select field in form"""
+        question = form_field.question
         if self.response_data and question not in self.response_data:
             return True
         try:
-            options = [
-                {"component": opt, "text": opt.text}
-                for opt in fieldset._get_elements(By.TAG_NAME, "label")
-            ]
-            clean_options = [opt["text"] for opt in options]
+            clean_options = form_field.options
 
             if not self.response_data:
                 self.questions.append(
                     {"question": question, "type": "options",
                         "options": clean_options}
                 )
-                for option in options:
+                if clean_options:
                     try:
-                        option["component"].click()
-                        return True
+                        self._click_option(form_field, 0)
                     except Exception as e4:
                         logger.error(
                             f"Error handling fieldset field: {str(e4)}")
-                    return True
+                return True
 
-            answer_text = metadata.get(question.replace("\n", "").lower(), "")
+            answer_text = self._metadata_answer(question)
             if not answer_text:
                 answer_text = self.response_data.get(question, " ")
 
@@ -500,29 +720,21 @@ class LinkedInSite(BaseSite):
                 for value in [
                     answer_text,
                     "Yes",
-                    options[0],
+                    clean_options[0] if clean_options else None,
                 ]:
-                    try:
-                        for option_all in options:
-                            try:
-                                if option_all["text"] == value:
-                                    option_all["component"].click()
-
-                                    return True
-
-                            except StaleElementReferenceException as e2:
-                                logger.error(
-                                    f"Error handling fieldset field: {str(e2)}"
-                                )
-                                raise StaleElementReferenceException(
-                                    "Stale element reference"
-                                )
-                            except Exception as e3:
-                                logger.error(
-                                    f"Error handling fieldset field: {str(e3)}"
-                                )
-                    except Exception:
+                    if value not in clean_options:
                         continue
+                    try:
+                        self._click_option(form_field, clean_options.index(value))
+                        return True
+                    except StaleElementReferenceException as e2:
+                        logger.error(
+                            f"Error handling fieldset field: {str(e2)}"
+                        )
+                    except Exception as e3:
+                        logger.error(
+                            f"Error handling fieldset field: {str(e3)}"
+                        )
 
         except Exception as e:
             logger.error(f"Error handling select field: {str(e)}")
@@ -536,17 +748,9 @@ class LinkedInSite(BaseSite):
             ):
                 self.wait_for_page_load()
                 while self.next_button():
-                    pb4s = modal._get_elements(By.CLASS_NAME, "pb4")
-                    for pb4 in pb4s:
-                        if h3 := pb4._get_element(By.TAG_NAME, "h3"):
-                            if h3.text == "Resume":
-                                continue
-                        self.wait_for_page_load()
-
-                        for section in pb4._get_elements(
-                            By.CLASS_NAME, self.selectors.APPLICATION["form"]["section"]
-                        ):
-                            self._handle_form_section(section)
+                    self.wait_for_page_load()
+                    for form_field in self._snapshot_form():
+                        self._handle_form_section(form_field)
                     next_button = self.next_button()
                     if (
                         checking
@@ -573,6 +777,13 @@ class LinkedInSite(BaseSite):
         except Exception as e:
             logger.error(f"Error saving application screenshot: {str(e)}")
 
+    def _footer_buttons(self) -> List[WebElementMod]:
+        """Buttons in the footer of the Easy Apply modal"""
+        _, buttons = self._find_first_of(
+            [f'{self.selectors.APPLICATION["form"]["modal"]} footer button']
+        )
+        return buttons
+
     def next_button(
         self, footer: Optional[WebElementMod] = None
     ) -> Optional[WebElementMod]:
@@ -584,14 +795,8 @@ class LinkedInSite(BaseSite):
             raise StaleElementReferenceException("No footer found")
         except StaleElementReferenceException as e:
             try:
-                if modal := self._get_element(
-                    By.CSS_SELECTOR, self.selectors.APPLICATION["form"]["modal"]
-                ):
-                    footer = modal._get_element(By.TAG_NAME, "footer")
-                    if not footer:
-                        return None
-                    buttons = footer._get_elements(By.TAG_NAME, "button")
-                    return buttons[-1] if buttons else None
+                buttons = self._footer_buttons()
+                return buttons[-1] if buttons else None
             except Exception as e:
                 logger.error(f"{str(e)}")
 
@@ -610,12 +815,8 @@ class LinkedInSite(BaseSite):
             raise StaleElementReferenceException("No footer found")
         except StaleElementReferenceException as e:
             try:
-                if modal := self._get_element(
-                    By.CSS_SELECTOR, self.selectors.APPLICATION["form"]["modal"]
-                ):
-                    footer = modal._get_element(By.TAG_NAME, "footer")
-                    buttons = footer._get_elements(By.TAG_NAME, "button")
-                    return buttons[0] if len(buttons) > 1 else None
+                buttons = self._footer_buttons()
+                return buttons[0] if len(buttons) > 1 else None
             except Exception as e:
                 logger.error(f"{str(e)}")
 
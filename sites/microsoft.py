@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Generator
+from typing import Dict, Optional, List, Generator, Set
 from urllib.parse import urlparse
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -12,10 +12,13 @@ from selenium.common.exceptions import (
 from .base_site import BaseSite, WebElementMod
 from loguru import logger
 import json
+import re
 import time
 from dataclasses import dataclass
 from contextlib import contextmanager
 from utils.utilities import retry
+from config.settings import settings
+from core.exceptions import DiscoveryException
 
 
 @dataclass
@@ -102,7 +105,7 @@ class MicrosoftSite(BaseSite):
                     By.CSS_SELECTOR, self.selectors.LOGIN["submit"]
                 )
                 self._safe_click(submit)
-                time.sleep(4)
+                self.wait_until_ready(timeout=4)
                 while (
                     "resend" in self.driver.page_source.lower()
                     or "security check" in self.driver.page_source.lower()
@@ -197,7 +200,7 @@ class MicrosoftSite(BaseSite):
                 )
                 if apply_button and not self.is_logged_in():
                     self._safe_click(apply_button)
-                    time.sleep(4)
+                    self.wait_until_ready(timeout=4)
                     self.login()
                     apply_button = self._get_element(
                         By.CSS_SELECTOR, self.selectors.APPLICATION["apply_button"]
@@ -212,15 +215,26 @@ class MicrosoftSite(BaseSite):
 
         return
 
-    def get_all_jobs(self, job_url: str) -> Generator:
-        """Get all matching jobs"""
+    def get_all_jobs(self, job_url: str, open_jobs: bool = True) -> Generator:
+        """Get all matching jobs, opened in the browser or as job urls"""
         base_url = "https://jobs.careers.microsoft.com/global/en/search"
         params = "?lc=India&d=Software%20Engineering&l=en_us&pgSz=20&o=Recent"
         page = 1
         if urlparse(job_url).netloc:
-            self.driver.get(job_url)
+            if open_jobs:
+                self.driver.get(job_url)
             yield job_url
             return
+        if settings.DISCOVERY_HTTP:
+            from .discovery import MicrosoftDiscovery
+
+            try:
+                yield from self._discover_jobs(
+                    MicrosoftDiscovery, self._processed_job_ids(), open_jobs
+                )
+                return
+            except DiscoveryException as e:
+                logger.warning(f"HTTP job discovery failed, using the browser: {e}")
         while page < 21:
             self.driver.get(f"{base_url}{params}&pg={page}")
             self.wait_for_page_load()
@@ -241,7 +255,7 @@ class MicrosoftSite(BaseSite):
                         self.wait_for_page_load()
 
                         if self._should_apply_to_job():
-                            yield job
+                            yield job if open_jobs else self.driver.current_url
 
                 except Exception as e:
                     logger.error(f"Failed to process job: {str(e)}")
@@ -249,10 +263,24 @@ class MicrosoftSite(BaseSite):
             else:
                 page += 1
 
+    @staticmethod
+    def _job_id(url: str) -> Optional[str]:
+        """Job id of a job url, with or without the title slug"""
+        match = re.search(r"/job/(\d+)", urlparse(url).path)
+        return match.group(1) if match else None
+
+    def _processed_job_ids(self) -> Set[str]:
+        """Job ids of the Microsoft urls in the processed file"""
+        return {
+            job_id
+            for url in self.get_processed or {}
+            if (job_id := self._job_id(url))
+        }
+
     def _should_apply_to_job(self) -> bool:
         """Determine if we should apply to this job"""
         try:
-            if self.driver.current_url in self.get_processed:
+            if self._job_id(self.driver.current_url) in self._processed_job_ids():
                 return False
             description = self._get_element(
                 By.CLASS_NAME, self.selectors.JOB_SEARCH["description"]
@@ -280,32 +308,22 @@ class MicrosoftSite(BaseSite):
     def _click_confirm_button(self) -> bool:
         """Click confirm/submit button with fallback options"""
         try:
-            # Try primary submit button
-            submit_buttons = self._get_elements(
-                By.CSS_SELECTOR, self.selectors.APPLICATION["confirm_button"]["submit"]
-            )
-            primary_buttons = self._get_elements(
-                By.CLASS_NAME, self.selectors.APPLICATION["confirm_button"]["primary"]
-            )
+            submit = self.selectors.APPLICATION["confirm_button"]["submit"]
+            primary = "." + self.selectors.APPLICATION["confirm_button"]["primary"]
 
-            confirm_buttons = submit_buttons + primary_buttons
+            # Try primary submit button
+            _, confirm_buttons = self._find_first_of([submit, primary], timeout=0)
             if confirm_buttons and self._safe_click(confirm_buttons[0]):
-                time.sleep(2)
+                self.wait_until_ready(timeout=2)
 
                 # Handle modal if present
-                modal = self._get_elements(
-                    By.CLASS_NAME, self.selectors.APPLICATION["modal"]
+                _, modal = self._find_first_of(
+                    ["." + self.selectors.APPLICATION["modal"]], timeout=0
                 )
                 if modal:
-                    submit_buttons = self._get_elements(
-                        By.CSS_SELECTOR,
-                        self.selectors.APPLICATION["confirm_button"]["submit"],
+                    _, confirm_buttons = self._find_first_of(
+                        [primary, submit], timeout=0
                     )
-                    primary_buttons = self._get_elements(
-                        By.CLASS_NAME,
-                        self.selectors.APPLICATION["confirm_button"]["primary"],
-                    )
-                    confirm_buttons = submit_buttons + primary_buttons
                     if confirm_buttons:
                         self._safe_click(confirm_buttons[-1])
             return True
@@ -359,8 +377,7 @@ class MicrosoftSite(BaseSite):
             return False
 
         self.driver.switch_to.window(new_tabs[0])
-        self.wait_for_page_load()
-        time.sleep(4)
+        self.wait_for_page_load(timeout=4.5)
         return True
 
     def _get_job_id(self) -> str:
@@ -378,7 +395,7 @@ class MicrosoftSite(BaseSite):
             )
             for element in checkmarks:
                 self._safe_click(element)
-            time.sleep(1)
+            self.wait_until_ready(timeout=1)
             return self._click_confirm_button()
         except Exception as e:
             logger.error(f"Error handling checkmarks: {str(e)}")
@@ -388,7 +405,7 @@ class MicrosoftSite(BaseSite):
     def _handle_authorization_questions(self) -> bool:
         """Handle authorization page questions"""
         logger.info("Handling Authorization page")
-        time.sleep(4)
+        self.wait_until_ready(selector="#isLegallyAuthorized-option", timeout=4)
 
         auth_questions = {
             "isLegallyAuthorized-option": "Yes",
@@ -411,7 +428,7 @@ class MicrosoftSite(BaseSite):
     @retry()
     def _handle_question_pages(self) -> bool:
         """Handle multiple pages of questions"""
-        time.sleep(1)
+        self.wait_until_ready(timeout=1)
         for page in range(5):
             if self._get_elements(By.TAG_NAME, "iframe"):
                 return True
@@ -455,13 +472,19 @@ class MicrosoftSite(BaseSite):
         """Handle a single question element"""
         question = div._get_element(By.TAG_NAME, "label").text
 
-        # Handle different input types
-        if select_elements := div._get_elements(By.TAG_NAME, "select"):
-            return self._handle_select_question(select_elements[0], question, div)
-        elif text_areas := div._get_elements(By.TAG_NAME, "textarea"):
-            return self._handle_text_question(text_areas[0], question)
-        elif checkboxes := div._get_elements(By.CSS_SELECTOR, "input[type='checkbox']"):
-            return self._handle_checkbox_question(checkboxes)
+        # Handle different input types, probed together so absent ones cost
+        # no wait
+        questions = self.selectors.APPLICATION["questions"]
+        index, elements = div._find_first_of(
+            [questions["select"], questions["textarea"], questions["checkbox"]],
+            timeout=0,
+        )
+        if index == 0:
+            return self._handle_select_question(elements[0], question, div)
+        elif index == 1:
+            return self._handle_text_question(elements[0], question)
+        elif index == 2:
+            return self._handle_checkbox_question(elements)
 
         return True
 
@@ -536,9 +559,9 @@ class MicrosoftSite(BaseSite):
                     "arguments[0].scrollIntoView();", submit_button
                 )
                 self._safe_click(submit_button)
-                time.sleep(3)
+                self.wait_until_ready(timeout=3)
             max_tries += 1
-            time.sleep(2)
+            self.wait_until_ready(timeout=2)
 
         return max_tries < 5
 
@@ -0,0 +1,172 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from llm_providers.tokens import count_tokens
+from utils.metrics import metrics
+
+# Headings of sections worth scoring against the resume
+KEEP_HEADINGS = re.compile(
+    r"responsibilit|requirement|qualification|what you.?ll do|what you will do|"
+    r"what you.?ll bring|skills|experience|the role|about the (role|job|position)|"
+    r"role overview|job (description|summary)|duties|must.have|nice.to.have|"
+    r"preferred|you have|you will|who you are|looking for|tech stack|"
+    r"technolog|what we expect|your profile|your impact|minimum|basic",
+    re.IGNORECASE,
+)
+
+# Headings of sections that say nothing about fit
+DROP_HEADINGS = re.compile(
+    r"equal (employment )?opportunit|\beeo\b|benefit|perks|about us|"
+    r"about (the )?company|who we are|our (company|story|mission|values|culture)|"
+    r"compensation|salary|pay (range|transparency)|privacy|accommodation|"
+    r"disclaimer|how to apply|why (join|work)|life at|diversity|inclusion|"
+    r"what we offer|we offer|additional information|legal",
+    re.IGNORECASE,
+)
+
+# Boilerplate sentences that show up in any section
+BOILERPLATE_LINES = re.compile(
+    r"equal opportunity employer|without regard to (race|age|sex|religion)|"
+    r"reasonable accommodation|protected veteran|e-verify|"
+    r"does not discriminate|applicants with disabilities|"
+    r"recruitment (fraud|scam)|privacy (notice|policy)",
+    re.IGNORECASE,
+)
+
+MAX_HEADING_CHARS = 60
+
+# List markers, a bulleted line is content and never a heading
+BULLET = re.compile(r"^([-*•·▪◦–]|\d+[.)])\s*")
+
+# Words a drop heading may have besides the DROP_HEADINGS phrase itself,
+# e.g. "Our Benefits" or "Perks & Benefits:"
+HEADING_FILLER = frozenset(
+    """a an and & of the our us at for to with company employer statement
+    information notice policy policies package details overview range program
+    programs""".split()
+)
+
+
+@dataclass
+class CleanedDescription:
+    text: str
+    tokens: int
+    chars_removed: int
+    tokens_removed: int
+
+
+def _is_heading(line: str) -> bool:
+    if len(line) > MAX_HEADING_CHARS or BULLET.match(line):
+        return False
+    return line.endswith(":") or not line.endswith((".", "!", "?", ","))
+
+
+def _is_drop_heading(line: str) -> bool:
+    """
+    A heading line made of a DROP_HEADINGS phrase and filler words only, so
+    a short bullet such as "Build internal compensation tooling" is content
+    """
+    spans = [match.span() for match in DROP_HEADINGS.finditer(line)]
+    if not spans:
+        return False
+    for word in re.finditer(r"[^\s:]+", line):
+        start, end = word.span()
+        if any(start < span_end and span_start < end for span_start, span_end in spans):
+            continue
+        if word.group().lower() not in HEADING_FILLER:
+            return False
+    return True
+
+
+def _segment(text: str) -> List[Tuple[Optional[str], List[str]]]:
+    """Split text into (heading, lines) sections, the first one has no heading"""
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    seen = set()
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        # Repeated headers and blank lines carry nothing
+        if not line or line.lower() in seen:
+            continue
+        seen.add(line.lower())
+
+        if _is_heading(line) and (
+            KEEP_HEADINGS.search(line) or _is_drop_heading(line)
+        ):
+            sections.append((line, []))
+        else:
+            sections[-1][1].append(line)
+    return sections
+
+
+def strip_boilerplate(description: str) -> CleanedDescription:
+    """
+    Keep the requirement and responsibility parts of a job description.
+
+    The description is segmented at known section headings. Benefits, EEO,
+    "about us" and similar sections are dropped along with boilerplate
+    sentences and repeated lines. Text under unknown headings is kept.
+
+    Bullets that mention a dropped topic stay in their section:
+
+    >>> strip_boilerplate(
+    ...     "Responsibilities:\\nBuild internal compensation tooling\\n"
+    ...     "Design REST APIs in Django\\nOwn deployments on AWS\\n"
+    ...     "Mentor junior engineers\\nRequirements:\\n3+ years of Python\\n"
+    ...     "Benefits:\\nHealth insurance"
+    ... ).text.splitlines()
+    ['Responsibilities:', 'Build internal compensation tooling', 'Design REST APIs in Django', 'Own deployments on AWS', 'Mentor junior engineers', 'Requirements:', '3+ years of Python']
+    >>> strip_boilerplate(
+    ...     "Responsibilities\\nShip privacy features\\nWrite Kotlin services\\n"
+    ...     "Scale Kafka pipelines\\nQualifications\\nKotlin\\n"
+    ...     "Perks & Benefits\\nFree lunch"
+    ... ).text.splitlines()
+    ['Responsibilities', 'Ship privacy features', 'Write Kotlin services', 'Scale Kafka pipelines', 'Qualifications', 'Kotlin']
+    """
+    if not description:
+        return CleanedDescription(description, 0, 0, 0)
+
+    kept = []
+    for heading, lines in _segment(description):
+        if (
+            heading
+            and DROP_HEADINGS.search(heading)
+            and not KEEP_HEADINGS.search(heading)
+        ):
+            continue
+        # Short bullets such as "Experience with Kubernetes" look like
+        # headings, so the heading itself is kept as content
+        lines = [heading, *lines] if heading else lines
+        kept.extend(line for line in lines if not BOILERPLATE_LINES.search(line))
+
+    text = "\n".join(kept)
+    if not text:
+        # Nothing recognisable survived, better to score the raw text
+        text = description
+
+    tokens = count_tokens(text)
+    return CleanedDescription(
+        text=text,
+        tokens=tokens,
+        chars_removed=len(description) - len(text),
+        tokens_removed=count_tokens(description) - tokens,
+    )
+
+
+def preprocess_description(description: str) -> str:
+    """Strip boilerplate from a job description before it is scored"""
+    if not settings.MATCH_STRIP_BOILERPLATE:
+        return description
+
+    cleaned = strip_boilerplate(description)
+    metrics.inc("jd_chars_removed", cleaned.chars_removed)
+    metrics.inc("jd_tokens_removed", cleaned.tokens_removed)
+    metrics.observe("jd_tokens_kept", cleaned.tokens)
+    logger.debug(
+        f"Removed {cleaned.chars_removed} chars "
+        f"({cleaned.tokens_removed} tokens) of job description boilerplate"
+    )
+    return cleaned.text
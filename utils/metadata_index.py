@@ -0,0 +1,177 @@
+import json
+import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from config.settings import settings
+from utils.similarity import STOP_WORDS, TOKEN_PATTERN
+
+# LinkedIn labels often repeat the question and end with "Required"
+REQUIRED_SUFFIX = re.compile(r"\s*\*?\s*required\s*$", re.IGNORECASE)
+
+# Negations flip the answer, so they stay in the terms of a question
+NEGATIONS = frozenset("not no never none without don doesn won isn aren".split())
+QUESTION_STOP_WORDS = STOP_WORDS - NEGATIONS
+
+# Yes/no eligibility questions differ only in a country or visa type, so a
+# near miss is never safe to answer from metadata
+ELIGIBILITY_QUESTION = re.compile(
+    r"\b(authori[sz]\w*|sponsor\w*|visas?|work permit|eligib\w*|right to work|citizen\w*)\b"
+)
+
+# Two different words count as the same term (e.g. "authorised" and
+# "authorized") only when both are this long and their trigrams agree
+FUZZY_TERM_MIN_LENGTH = 5
+FUZZY_TERM_THRESHOLD = 0.7
+
+
+def normalize_question(text: str) -> str:
+    """
+    Lowercase, collapse whitespace and drop a doubled question text
+
+    >>> normalize_question("Do you need a visa?\\nDo you need a visa?\\nRequired")
+    'do you need a visa?'
+    """
+    text = re.sub(r"\s+", " ", str(text)).strip().lower()
+    text = REQUIRED_SUFFIX.sub("", text).strip()
+    if doubled := re.fullmatch(r"(.+?)\s*\1", text):
+        text = doubled.group(1)
+    return text.strip()
+
+
+def _terms(text: str) -> List[str]:
+    return [
+        word
+        for word in TOKEN_PATTERN.findall(text)
+        if word not in QUESTION_STOP_WORDS
+    ]
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _dice(a: Set[str], b: Set[str]) -> float:
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+def _same_term(word: str, other: str) -> bool:
+    if word == other:
+        return True
+    if min(len(word), len(other)) < FUZZY_TERM_MIN_LENGTH:
+        return False
+    return _dice(_trigrams(word), _trigrams(other)) >= FUZZY_TERM_THRESHOLD
+
+
+def _covers(key_terms: Set[str], question_terms: Set[str]) -> bool:
+    """True when every content term of the question appears in the key"""
+    return all(
+        any(_same_term(word, other) for other in key_terms)
+        for word in question_terms
+    )
+
+
+class MetadataIndex:
+    """
+    Fuzzy lookup of screening questions in metadata.json.
+
+    Keys are normalized once and indexed by character trigrams of their
+    content words (negations included). A question is answered from metadata
+    when every content word of the question is covered by a key, that key
+    scores at least ``threshold`` (Dice coefficient of the trigram sets) and
+    it clearly beats any key with a different answer. Eligibility questions
+    (work authorization, sponsorship) only match exactly or after stop words
+    and punctuation are removed; anything else is left to the LLM.
+    """
+
+    def __init__(self, metadata: Dict[str, Any], threshold: float = None):
+        self.threshold = (
+            settings.METADATA_MATCH_THRESHOLD if threshold is None else threshold
+        )
+        # Keys as the LinkedIn handlers looked them up before the index
+        self.raw: Dict[str, Any] = dict(metadata)
+        self.exact: Dict[str, Any] = {}
+        self.by_terms: Dict[str, Any] = {}
+        self.entries: List[Tuple[str, Set[str], Set[str], Any]] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+
+        for key, value in metadata.items():
+            normalized = normalize_question(key)
+            self.exact[normalized] = value
+            terms = _terms(normalized)
+            self.by_terms.setdefault(" ".join(terms), value)
+            grams = _trigrams(" ".join(terms))
+            for gram in grams:
+                self.postings[gram].append(len(self.entries))
+            self.entries.append((key, grams, set(terms), value))
+
+    def match(self, question: str) -> Optional[Tuple[str, Any, float]]:
+        """
+        Best (key, value, score) for question, None below the threshold
+
+        >>> index = MetadataIndex({"require visa sponsorship?require visa sponsorship?required": "No"})
+        >>> index.match("Require visa sponsorship?\\nRequire visa sponsorship?\\nRequired")[1]
+        'No'
+        """
+        raw_key = str(question).replace("\n", "").lower()
+        if raw_key in self.raw:
+            return raw_key, self.raw[raw_key], 1.0
+        normalized = normalize_question(question)
+        if normalized in self.exact:
+            return normalized, self.exact[normalized], 1.0
+
+        terms = _terms(normalized)
+        if not terms:
+            return None
+        joined = " ".join(terms)
+        if joined in self.by_terms:
+            return normalized, self.by_terms[joined], 1.0
+        if ELIGIBILITY_QUESTION.search(normalized):
+            return None
+
+        grams = _trigrams(joined)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for entry in self.postings.get(gram, ()):
+                shared[entry] += 1
+
+        question_terms = set(terms)
+        scored = sorted(
+            (
+                (2 * count / (len(grams) + len(self.entries[entry][1])), entry)
+                for entry, count in shared.items()
+                if _covers(self.entries[entry][2], question_terms)
+            ),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < self.threshold:
+            return None
+
+        score, best = scored[0]
+        key, _, _, value = self.entries[best]
+        # A close runner-up with another answer (e.g. current vs expected CTC)
+        # makes the match ambiguous
+        for other_score, other in scored[1:]:
+            if score - other_score > settings.METADATA_MATCH_MARGIN:
+                break
+            if self.entries[other][3] != value:
+                logger.debug(f"Ambiguous metadata match for {question!r}")
+                return None
+        return key, value, score
+
+    def lookup(self, question: str, default: Any = None) -> Any:
+        if match := self.match(question):
+            return match[1]
+        return default
+
+
+@lru_cache(maxsize=1)
+def get_metadata_index(metadata_file: Path = None) -> MetadataIndex:
+    """Shared index built from data/metadata.json"""
+    with open(metadata_file or settings.DATA_DIR / "metadata.json") as f:
+        return MetadataIndex(json.load(f))
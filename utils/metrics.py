@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Tuple
+
+from loguru import logger
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    return ",".join(f"{key}={value}" for key, value in labels)
+
+
+# Most recent observations a histogram keeps for its percentiles
+HISTOGRAM_WINDOW = 2048
+
+
+class Histogram:
+    """
+    Observed values of a single metric, summarized on demand.
+
+    Count, sum and max cover every observation, percentiles only the last
+    ``window`` of them so memory stays bounded over a long run.
+    """
+
+    def __init__(self, window: int = HISTOGRAM_WINDOW):
+        self.values: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.values.append(value)
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value) if self.count > 1 else value
+
+    def percentile(self, percentile: float) -> float:
+        values = sorted(self.values)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * percentile))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "mean": round(self.sum / self.count, 3) if self.count else 0.0,
+            "p50": round(self.percentile(0.5), 3),
+            "p90": round(self.percentile(0.9), 3),
+            "p99": round(self.percentile(0.99), 3),
+            "max": round(self.max, 3),
+        }
+
+
+class MetricsRegistry:
+    """
+    In-process counters and histograms, keyed by name and labels.
+
+    Metrics live for the lifetime of the process, ``log_summary`` reports
+    them at the end of a run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+
+    def inc(self, name: str, value: int = 1, **labels) -> None:
+        with self._lock:
+            self.counters[(name, _labels(labels))] += value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the wall time of the block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def total(self, name: str, **labels) -> float:
+        """Sum of a histogram (or counter) over every label set matching labels"""
+        wanted = set(_labels(labels))
+        with self._lock:
+            histograms = sum(
+                histogram.sum
+                for (metric, metric_labels), histogram in self.histograms.items()
+                if metric == name and wanted <= set(metric_labels)
+            )
+            counters = sum(
+                value
+                for (metric, metric_labels), value in self.counters.items()
+                if metric == name and wanted <= set(metric_labels)
+            )
+        return histograms + counters
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                "counters": {
+                    f"{name}{{{_format_labels(labels)}}}": value
+                    for (name, labels), value in sorted(self.counters.items())
+                },
+                "histograms": {
+                    f"{name}{{{_format_labels(labels)}}}": histogram.summary()
+                    for (name, labels), histogram in sorted(self.histograms.items())
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def log_summary(self, run_seconds: float = None) -> None:
+        """Log every metric and the LLM vs browser split of the run"""
+        snapshot = self.snapshot()
+        logger.info("Run summary")
+        for name, value in snapshot["counters"].items():
+            logger.info(f"  {name}: {value}")
+        for name, summary in snapshot["histograms"].items():
+            logger.info(
+                f"  {name}: n={summary['count']} sum={summary['sum']} "
+                f"mean={summary['mean']} p50={summary['p50']} "
+                f"p90={summary['p90']} p99={summary['p99']} max={summary['max']}"
+            )
+
+        if run_seconds:
+            llm_seconds = self.total("llm_request_seconds", role="call")
+            browser_seconds = max(0.0, run_seconds - llm_seconds)
+            logger.info(
+                f"  wall time {run_seconds:.1f}s: "
+                f"LLM {llm_seconds:.1f}s ({llm_seconds / run_seconds:.0%}), "
+                f"browser and other {browser_seconds:.1f}s "
+                f"({browser_seconds / run_seconds:.0%})"
+            )
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,93 @@
+import json
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Union
+
+import numpy as np
+from loguru import logger
+
+from config.settings import settings
+
+STOP_WORDS = frozenset(
+    """a an and are as at be by for from has have in is it its of on or our that the
+    this to was we were will with you your they their who what which when where how
+    all any can do not no so if but than then there these those us also more such""".split()
+)
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+
+def _collect_text(data: Union[dict, list, str, int, float]) -> Iterable[str]:
+    """Yield all string values from nested resume data"""
+    if isinstance(data, dict):
+        for value in data.values():
+            yield from _collect_text(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _collect_text(value)
+    elif isinstance(data, str):
+        yield data
+
+
+class ResumePrefilter:
+    """
+    Cheap local similarity between the resume and a job description.
+
+    Text is turned into hashed unigram/bigram vectors (sublinear term
+    frequency, L2 normalized) and compared with cosine similarity. The resume
+    vector is computed once, so each job costs a single vectorization.
+    """
+
+    def __init__(self, resume: dict, dimensions: int = 2**14):
+        self.dimensions = dimensions
+        resume = {key: value for key, value in resume.items() if key != "personalInfo"}
+        self.resume_vector = self.vectorize(" ".join(_collect_text(resume)))
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        words = [
+            word
+            for word in TOKEN_PATTERN.findall(text.lower())
+            if word not in STOP_WORDS
+        ]
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def vectorize(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        tokens = self.tokenize(text)
+        if not tokens:
+            return vector
+
+        buckets = np.fromiter(
+            (zlib.crc32(token.encode("utf-8")) % self.dimensions for token in tokens),
+            dtype=np.int64,
+            count=len(tokens),
+        )
+        counts = np.bincount(buckets, minlength=self.dimensions).astype(np.float32)
+        nonzero = counts > 0
+        vector[nonzero] = 1.0 + np.log(counts[nonzero])
+        return vector / np.linalg.norm(vector)
+
+    def similarity(self, job_description: str) -> float:
+        return float(np.dot(self.resume_vector, self.vectorize(job_description)))
+
+    def is_candidate(self, job_description: str, floor: float = None) -> bool:
+        """Return False for jobs clearly below the similarity floor"""
+        floor = settings.MATCH_PREFILTER_FLOOR if floor is None else floor
+        if floor <= 0:
+            return True
+
+        score = self.similarity(job_description)
+        if score < floor:
+            logger.info(f"Skipping job below local similarity floor ({score:.3f})")
+            return False
+        return True
+
+
+@lru_cache(maxsize=1)
+def get_prefilter(resume_file: Path = None) -> ResumePrefilter:
+    """Shared prefilter built from data/resume.json"""
+    with open(resume_file or settings.DATA_DIR / "resume.json") as f:
+        return ResumePrefilter(json.load(f))